@@ -1,15 +1,292 @@
 import caldav
-from caldav.elements import dav
+from caldav.elements import dav, cdav
+from caldav.elements.base import BaseElement, NamedBaseElement
 from caldav.lib.error import AuthorizationError as CalDAVAuthorizationError # Renamed to avoid conflict
-from datetime import datetime, date, timedelta
-import pytz # For timezone handling
+from caldav.lib.error import DeleteError, NotFoundError, PutError
+from datetime import datetime, date, timedelta, timezone
+from icalendar import Calendar # For reading event times when serving a sub-range from cache
 import requests # For requests.exceptions.ConnectionError
-from icalendar import Calendar # For parsing iCalendar data
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import asyncio
+import functools
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the HTTP session shared by all requests of a service.
+# Keep-alive connections are reused, so only the first request to a host pays
+# the TCP/TLS handshake.
+HTTP_POOL_CONNECTIONS = 20
+HTTP_POOL_MAXSIZE = 100
+
+# Transient failures (refused connections, dropped keep-alive sockets) are retried
+# with a short backoff. Read errors are only retried for idempotent methods, which
+# include the WebDAV reads; POST is never retried.
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"PROPFIND", "REPORT"}
+)
+
+# Default number of worker threads each service keeps for its blocking CalDAV calls.
+THREAD_POOL_SIZE = 16
+
+# How long (in seconds) a fetched calendar list is served from memory before
+# get_calendars() asks the server again.
+CALENDARS_CACHE_TTL = 60
+
+# Stale-while-revalidate windows (in seconds). Once fresh data is older than its TTL,
+# it is still served for up to this long while a background refresh runs, so
+# callers do not wait on the server.
+CALENDARS_STALE_TTL = 600
+CTAG_FRESH_TTL = 60
+CTAG_STALE_TTL = 600
+
+# Default window for get_events() when no start/end date is given.
+DEFAULT_EVENTS_PAST = timedelta(days=30)
+DEFAULT_EVENTS_FUTURE = timedelta(days=365)
+
+# Upper bound (in seconds) on how long a CTag-validated event/task listing is
+# reused, so entries do not live forever even if the collection never changes.
+COLLECTION_CACHE_MAX_AGE = 300
+
+# Number of calendar handles each service keeps for reuse (least recently used are dropped).
+CALENDAR_HANDLE_CACHE_SIZE = 64
+
+# Maximum number of fetched date windows kept per calendar for the event cache.
+MAX_CACHED_EVENT_WINDOWS = 32
+
+class GetCTag(BaseElement):
+    """
+    The CalendarServer collection tag. Servers change it whenever any object in the
+    collection is added, modified or removed.
+    """
+    tag = "{http://calendarserver.org/ns/}getctag"
+
+class CalendarDataProp(NamedBaseElement):
+    """A <C:prop name="..."/> inside calendar-data, selecting one iCalendar property to return."""
+    tag = "{urn:ietf:params:xml:ns:caldav}prop"
+
+class CalendarDataAllComp(BaseElement):
+    """A <C:allcomp/> inside calendar-data, returning all subcomponents."""
+    tag = "{urn:ietf:params:xml:ns:caldav}allcomp"
+
+# Properties always returned when a listing asks for only some properties, so results
+# can still be range-checked, sorted and filtered for completion.
+EVENT_BASE_PROPS = ("UID", "DTSTART", "DTEND", "DURATION", "RRULE", "RDATE", "EXDATE", "RECURRENCE-ID")
+TASK_BASE_PROPS = ("UID", "STATUS", "COMPLETED", "DUE", "PRIORITY")
+
+# Property elements used in PROPFIND requests. They have no children or value, so
+# get_property() never mutates them and one instance can be shared by every request.
+DISPLAYNAME_PROP = dav.DisplayName()
+CTAG_PROP = GetCTag()
+GETETAG_PROP = dav.GetEtag()
+
+# search() options for listing events. They match what the deprecated date_search()
+# sent, and also ask for each object's ETag so later updates can be conditional PUTs.
+EVENT_SEARCH_OPTIONS = {"event": True, "expand": True, "split_expanded": False, "props": [GETETAG_PROP]}
+# Sort order for task listings, the same one todos() uses.
+TASK_SORT_KEYS = ("due", "priority")
+
+# Number of parsed calendars kept in the (url, etag)-keyed parse cache shared by
+# all LazyICal instances.
+PARSED_ICAL_CACHE_SIZE = 4096
+_parsed_ical_cache = OrderedDict()
+
+class LazyICal(str):
+    """
+    Raw iCalendar text as returned by the server, parsed only when asked for.
+
+    It is a plain `str` for every other purpose (JSON output, comparisons, slicing),
+    so callers that only pass the data along never pay for parsing it.
+
+    When built with a `cache_key` of (url, etag), the parsed calendar is shared through
+    an LRU cache, so a later fetch of the same unchanged object is not parsed again.
+    A new ETag means a new key, so stale entries simply age out. Parsed calendars
+    may be shared and should be treated as read-only.
+    """
+    def __new__(cls, data, cache_key=None):
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        instance = super().__new__(cls, data)
+        instance._cache_key = cache_key
+        return instance
+
+    def parsed(self):
+        """Returns the full `icalendar.Calendar`, parsing it on first access."""
+        try:
+            return self._parsed
+        except AttributeError:
+            pass
+        key = self._cache_key
+        if key is not None and key in _parsed_ical_cache:
+            _parsed_ical_cache.move_to_end(key)
+            self._parsed = _parsed_ical_cache[key]
+            return self._parsed
+        self._parsed = Calendar.from_ical(str(self))
+        if key is not None:
+            _parsed_ical_cache[key] = self._parsed
+            if len(_parsed_ical_cache) > PARSED_ICAL_CACHE_SIZE:
+                _parsed_ical_cache.popitem(last=False)
+        return self._parsed
+
+def _find_element(element, element_class):
+    """Depth-first search for the first element of `element_class` in a caldav XML element tree."""
+    if isinstance(element, element_class):
+        return element
+    for child in element.children:
+        found = _find_element(child, element_class)
+        if found is not None:
+            return found
+    return None
+
+def _task_search_args(calendar_obj, include_completed, only_props=None):
+    """
+    Builds search() arguments for listing tasks with their ETags in one calendar-query
+    REPORT. Unless `include_completed` is set, the query asks the server to leave out
+    tasks that have a COMPLETED date.
+
+    search(include_completed=False) is not used: caldav sends three sub-queries for it
+    and drops `props`, so no ETags would come back. Its STATUS text-match filters are
+    also avoided, since some servers (Nextcloud, Baikal) then drop tasks with no STATUS.
+    """
+    filters = [] if include_completed else [cdav.PropFilter("COMPLETED") + cdav.NotDefined()]
+    if only_props:
+        search_args = _partial_search_args(calendar_obj, "VTODO", only_props, TASK_BASE_PROPS, todo=True, filters=filters)
+    else:
+        xml, comp_class = calendar_obj.build_search_xml_query(todo=True, filters=filters, props=[GETETAG_PROP])
+        search_args = {"xml": xml, "comp_class": comp_class, "props": [GETETAG_PROP]}
+    search_args["sort_keys"] = TASK_SORT_KEYS
+    return search_args
+
+def _partial_search_args(calendar_obj, component, only_props, base_props, **query):
+    """
+    Builds search() arguments for a calendar-query REPORT whose calendar-data returns
+    only the given properties of `component` (plus `base_props` and full VTIMEZONEs),
+    instead of whole objects.
+    """
+    xml, comp_class = calendar_obj.build_search_xml_query(props=[GETETAG_PROP], **query)
+    wanted = dict.fromkeys(name.upper() for name in (*base_props, *only_props))
+    requested = cdav.Comp(component) + [CalendarDataProp(name) for name in wanted]
+    timezones = cdav.Comp("VTIMEZONE") + [cdav.Allprop(), CalendarDataAllComp()]
+    _find_element(xml, cdav.CalendarData).append(
+        cdav.Comp("VCALENDAR") + [CalendarDataProp("VERSION"), CalendarDataProp("PRODID"), timezones, requested]
+    )
+    return {"xml": xml, "comp_class": comp_class, "props": [GETETAG_PROP]}
+
+# Line scans over raw iCalendar bytes. Property names are case-insensitive, and a
+# STATUS line may carry parameters before its value.
+VTODO_LINE = re.compile(rb"^BEGIN:VTODO[ \t]*\r?$", re.IGNORECASE | re.MULTILINE)
+COMPLETED_STATUS_LINE = re.compile(rb"^STATUS(?:;[^:\r\n]*)?:(?:COMPLETED|CANCELLED)[ \t]*\r?$", re.IGNORECASE | re.MULTILINE)
+# Occurrences produced by expanding a recurring event each carry a RECURRENCE-ID.
+RECURRENCE_ID_LINE = re.compile(rb"^RECURRENCE-ID[;:]", re.IGNORECASE | re.MULTILINE)
+
+def _as_bytes(data):
+    """Returns iCalendar data (str or bytes) as bytes for line scans."""
+    return data.encode() if isinstance(data, str) else data
+
+def _is_vtodo(data):
+    """Checks for a VTODO component with a byte scan instead of parsing the calendar."""
+    return data is not None and VTODO_LINE.search(_as_bytes(data)) is not None
+
+def _is_completed(data):
+    """Checks for a STATUS:COMPLETED or STATUS:CANCELLED line with a byte scan instead of parsing the calendar."""
+    return COMPLETED_STATUS_LINE.search(_as_bytes(data)) is not None
+
+def _is_expanded(data):
+    """
+    Checks for RECURRENCE-ID lines with a byte scan. Expanded listing data only holds the
+    occurrences inside the queried range, so it differs from the stored body and between ranges.
+    """
+    return isinstance(data, (str, bytes)) and RECURRENCE_ID_LINE.search(_as_bytes(data)) is not None
+
+def _body_digest(data):
+    """A short digest of an iCalendar body, for spotting updates that change nothing."""
+    return hashlib.blake2b(_as_bytes(data), digest_size=16).digest()
+
+def _as_utc(value):
+    """
+    Normalizes a date or datetime to an aware UTC datetime for range comparisons.
+    Dates become midnight UTC and floating (naive) times are read as UTC.
+    """
+    if not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def _missing_intervals(start, end, covered):
+    """
+    Returns the parts of [start, end) not covered by any of the (start, end) pairs
+    in `covered`, in ascending order.
+    """
+    missing = []
+    cursor = start
+    for covered_start, covered_end in sorted(covered):
+        if covered_end <= cursor or covered_start >= end:
+            continue
+        if covered_start > cursor:
+            missing.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+def _event_in_range(ical_data, start, end):
+    """
+    Checks whether an event overlaps [start, end), mirroring the server's time-range
+    filter closely enough to serve a sub-range from a larger cached window.
+    Recurring or unparseable events are kept, since their occurrences are not expanded here.
+    """
+    try:
+        cal = ical_data.parsed() if isinstance(ical_data, LazyICal) else Calendar.from_ical(ical_data)
+    except ValueError:
+        return True
+    for component in cal.walk('VEVENT'):
+        if 'RRULE' in component or 'RDATE' in component or 'DTSTART' not in component:
+            return True
+        raw_start = component['DTSTART'].dt
+        event_start = _as_utc(raw_start)
+        if 'DTEND' in component:
+            event_end = _as_utc(component['DTEND'].dt)
+        elif 'DURATION' in component:
+            event_end = event_start + component['DURATION'].dt
+        elif not isinstance(raw_start, datetime):
+            event_end = event_start + timedelta(days=1) # All-day event without an end
+        else:
+            event_end = event_start
+        if event_start < end and (event_end > start or (event_end == event_start and event_start >= start)):
+            return True
+    return False
+
+def _batch_result(url_key, url, outcome):
+    """
+    Builds the per-URL result of a batch deletion from an HTTP status or an exception.
+    As for a single deletion, an object that is already gone (404) counts as deleted.
+    """
+    if isinstance(outcome, Exception):
+        logger.error("Batch operation failed for %s: %s", url, outcome)
+        return {"status": "error", url_key: url, "message": str(outcome)}
+    if outcome not in (200, 204, 404):
+        logger.error("Batch operation failed for %s with HTTP status %s", url, outcome)
+        return {"status": "error", url_key: url, "message": f"Server returned HTTP status {outcome}"}
+    return {"status": "success", url_key: url}
+
+def _calendar_result(items_key, calendar_url, outcome):
+    """Builds the per-calendar result of a multi-calendar listing from its items or an exception."""
+    if isinstance(outcome, Exception):
+        logger.error("Listing failed for calendar %s: %s", calendar_url, outcome)
+        return {"status": "error", "calendar_url": calendar_url, "message": str(outcome)}
+    return {"status": "success", "calendar_url": calendar_url, items_key: outcome}
+
 # Custom exception for CalDAV connection errors
 class CalDAVConnectionError(Exception):
     """Custom exception for errors during CalDAV server connection or authentication."""
@@ -20,7 +297,7 @@ class CalDAVService:
     Service class for interacting with a CalDAV server (e.g., Nextcloud Calendar).
     It handles connection, authentication, and various calendar and task operations.
     """
-    def __init__(self, url, username, password):
+    def __init__(self, url, username, password, max_workers: int = THREAD_POOL_SIZE):
         """
         Initializes the CalDAVService with server credentials.
 
@@ -28,101 +305,534 @@ class CalDAVService:
             url (str): The base URL of the CalDAV server.
             username (str): The username for authentication.
             password (str): The password (or app password) for authentication.
+            max_workers (int): Size of the thread pool used for blocking CalDAV calls.
         """
         self.url = url
         self.username = username
         self.password = password
         self.client = None
         self.principal = None
+        # One pooled session for the lifetime of the service, reused across reconnects.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=HTTP_RETRY,
+            pool_block=False
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # A dedicated pool for the blocking calls, so they neither queue behind nor
+        # starve other work on the event loop's shared default executor. It also bounds
+        # every gathered fan-out; keeping it within the HTTP pool means concurrent
+        # requests never open connections the adapter would have to discard.
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, HTTP_POOL_MAXSIZE)), thread_name_prefix="caldav"
+        )
+        # The principal is fetched once and kept for the lifetime of the service;
+        # the lock stops concurrent first calls from each running discovery.
+        self._connect_lock = asyncio.Lock()
+        # Set once connect() has succeeded; the fast path of every method checks it
+        self._connected = asyncio.Event()
+        # (monotonic timestamp, calendars list) of the last get_calendars() fetch
+        self._calendars_cache = None
+        self._calendars_ttl = CALENDARS_CACHE_TTL
+        self._calendars_stale_ttl = CALENDARS_STALE_TTL
+        # calendar_url -> (ctag, monotonic timestamp of the check)
+        self._ctags = {}
+        self._ctag_fresh_ttl = CTAG_FRESH_TTL
+        self._ctag_stale_ttl = CTAG_STALE_TTL
+        # calendar_url -> count of our own writes, bumped by _forget_ctag()
+        self._ctag_generations = {}
+        # refresh key -> background revalidation task, so each key has at most one
+        self._refreshes = {}
+        # listing key -> future of the fetch currently running for it
+        self._inflight = {}
+        # (kind, calendar_url, *query args) -> (ctag, monotonic timestamp, items)
+        self._collection_cache = {}
+        # (calendar_url, only_props) -> (ctag, [(window start, window end, monotonic timestamp, events, expanded)])
+        self._event_windows = {}
+        # object url -> (component name, etag) seen in listings or returned by our own PUTs
+        self._etags = {}
+        # object url -> (etag, digest of the body stored under that etag)
+        self._body_digests = {}
+        # calendar_url -> caldav Calendar handle, bounded to CALENDAR_HANDLE_CACHE_SIZE
+        self._calendar_handles = OrderedDict()
 
     async def connect(self):
         """
         Establishes a connection to the CalDAV server and retrieves the principal.
         Raises CalDAVConnectionError if connection or authentication fails.
+
+        Connecting happens once: concurrent callers wait on the lock and return as
+        soon as the first call has succeeded, so no client is replaced mid-use.
         """
-        logger.info(f"Attempting to connect to CalDAV server at {self.url} for user {self.username}...")
-        try:
-            self.client = caldav.DAVClient(
-                url=self.url,
-                username=self.username,
-                password=self.password
-            )
-            # Wrap the synchronous call in asyncio.to_thread
-            self.principal = await asyncio.to_thread(self.client.principal)
+        async with self._connect_lock:
+            if self._connected.is_set():
+                return
+            logger.info("Attempting to connect to CalDAV server at %s for user %s...", self.url, self.username)
+            try:
+                client = caldav.DAVClient(
+                    url=self.url,
+                    username=self.username,
+                    password=self.password
+                )
+                # Replace the client's own session with our pooled keep-alive session
+                client.session = self._session
+                # Run the synchronous call in the service's thread pool
+                principal = await self._run(client.principal)
+            except requests.exceptions.ConnectionError as e:
+                logger.error("CalDAV connection failed for %s: %s", self.url, e)
+                raise CalDAVConnectionError(f"Connection to CalDAV server failed: {e}")
+            except CalDAVAuthorizationError as e:
+                logger.error("CalDAV authentication failed for user %s at %s: %s", self.username, self.url, e)
+                raise CalDAVConnectionError(f"Authentication failed for CalDAV server: {e}")
+            except Exception as e:
+                logger.error("An unexpected error occurred during CalDAV connection for %s: %s", self.url, e)
+                logger.debug("Traceback of the connection error:", exc_info=True)
+                raise CalDAVConnectionError(f"An unexpected error occurred during CalDAV connection: {e}")
+            # Only publish the client once the principal lookup has succeeded
+            self.client = client
+            self.principal = principal
+            self._calendar_handles.clear() # Handles are bound to the client that built them
+            self._connected.set()
             logger.info("Successfully connected to CalDAV server and fetched principal.")
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"CalDAV connection failed for {self.url}: {e}")
-            raise CalDAVConnectionError(f"Connection to CalDAV server failed: {e}")
-        except CalDAVAuthorizationError as e:
-            logger.error(f"CalDAV authentication failed for user {self.username} at {self.url}: {e}")
-            raise CalDAVConnectionError(f"Authentication failed for CalDAV server: {e}")
+
+    async def _ensure_connected(self):
+        """
+        Connects on first use. Once connected this is a flag check, with no lock taken.
+        """
+        if not self._connected.is_set():
+            await self.connect()
+
+    def _calendar(self, calendar_url):
+        """
+        Returns the calendar handle for `calendar_url`, reusing one built earlier.
+        Building a handle does no I/O, so this only saves the object construction.
+        """
+        calendar_obj = self._calendar_handles.get(calendar_url)
+        if calendar_obj is None:
+            calendar_obj = self.client.calendar(url=calendar_url)
+            self._calendar_handles[calendar_url] = calendar_obj
+            if len(self._calendar_handles) > CALENDAR_HANDLE_CACHE_SIZE:
+                self._calendar_handles.popitem(last=False)
+        else:
+            self._calendar_handles.move_to_end(calendar_url)
+        return calendar_obj
+
+    async def _get_ctag(self, calendar_obj):
+        """
+        Fetches the collection tag of a calendar with a Depth:0 PROPFIND.
+        Returns None if the server does not expose one.
+        """
+        try:
+            # Run the synchronous call in the service's thread pool
+            return await self._run(calendar_obj.get_property, CTAG_PROP)
         except Exception as e:
-            logger.error(f"An unexpected error occurred during CalDAV connection for {self.url}: {e}", exc_info=True)
-            raise CalDAVConnectionError(f"An unexpected error occurred during CalDAV connection: {e}")
+            logger.debug("Could not fetch CTag for calendar %s: %s", calendar_obj.url, e)
+            return None
+
+    async def _checked_ctag(self, calendar_url, calendar_obj):
+        """
+        Returns the calendar's CTag, asking the server at most once per
+        `CTAG_FRESH_TTL`. A stale CTag is still returned while a background check
+        updates it, so the listing after that sees any change.
+        """
+        entry = self._ctags.get(calendar_url)
+        if entry is not None:
+            ctag, checked_at = entry
+            age = time.monotonic() - checked_at
+            if age < self._ctag_fresh_ttl:
+                return ctag
+            if age < self._ctag_stale_ttl:
+                self._refresh_in_background(("ctag", calendar_url), self._check_ctag(calendar_url, calendar_obj))
+                return ctag
+        return await self._check_ctag(calendar_url, calendar_obj)
+
+    async def _check_ctag(self, calendar_url, calendar_obj):
+        generation = self._ctag_generations.setdefault(calendar_url, 0)
+        ctag = await self._get_ctag(calendar_obj)
+        if self._ctag_generations[calendar_url] != generation:
+            # One of our own writes landed while we asked, so this CTag may predate it
+            return None
+        if ctag is None:
+            self._ctags.pop(calendar_url, None) # Nothing to validate against; always refetch
+        else:
+            self._ctags[calendar_url] = (ctag, time.monotonic())
+        return ctag
+
+    def _forget_ctag(self, object_url):
+        """
+        Drops the checked CTag of every calendar containing `object_url`, so the next
+        listing asks the server instead of serving data from before our own write.
+        """
+        object_url = str(object_url)
+        for calendar_url in self._ctag_generations:
+            if object_url.startswith(calendar_url):
+                self._ctags.pop(calendar_url, None)
+                # Checks still running were sent before the write; their CTag is not stored
+                self._ctag_generations[calendar_url] += 1
+
+    async def _coalesced(self, key, fetch):
+        """
+        Runs `fetch()` once for concurrent callers with the same key; the others await
+        the same result instead of sending their own requests. Each caller gets its
+        own copies of the returned dicts.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded, so one cancelled caller does not cancel the fetch for the others
+        result = await asyncio.shield(future)
+        return [dict(item) for item in result]
+
+    def _refresh_in_background(self, key, coro):
+        """Runs `coro` as the background refresh for `key`, unless one is already running."""
+        if key in self._refreshes:
+            coro.close()
+            return
+        task = asyncio.create_task(coro)
+        self._refreshes[key] = task
+
+        def _done(finished):
+            self._refreshes.pop(key, None)
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.warning("Background refresh %s failed: %s", key, finished.exception())
+        task.add_done_callback(_done)
+
+    def _cached_collection(self, key, ctag):
+        """Returns a copy of the cached listing for `key` if it is still valid for `ctag`."""
+        entry = self._collection_cache.get(key)
+        if ctag is None or entry is None:
+            return None
+        cached_ctag, fetched_at, items = entry
+        if cached_ctag != ctag or time.monotonic() - fetched_at >= COLLECTION_CACHE_MAX_AGE:
+            return None
+        return [dict(item) for item in items]
+
+    def _cached_event_windows(self, window_key, ctag):
+        """Returns the cached event windows of a (calendar, properties) key that are still valid for `ctag`."""
+        entry = self._event_windows.get(window_key)
+        if ctag is None or entry is None or entry[0] != ctag:
+            self._event_windows.pop(window_key, None)
+            return []
+        now = time.monotonic()
+        return [window for window in entry[1] if now - window[2] < COLLECTION_CACHE_MAX_AGE]
+
+    def _remember_etag(self, obj, component, partial=False):
+        """
+        Records the ETag a listing returned for `obj`, if the server sent one, and unless
+        the data is `partial` (only_props, or an expanded recurring event) the digest of
+        the body stored under it.
+        """
+        props = getattr(obj, 'props', None)
+        etag = props.get(GETETAG_PROP.tag) if isinstance(props, dict) else None
+        if etag:
+            url = str(obj.url)
+            self._etags[url] = (component, etag)
+            data = getattr(obj, 'data', None)
+            if not partial and isinstance(data, (str, bytes)):
+                self._body_digests[url] = (etag, _body_digest(data))
+
+    def _is_unchanged(self, url: str, ical_content, component: str):
+        """
+        Checks whether `ical_content` is byte-identical to the body last seen for
+        `url` under its currently known ETag, in which case a PUT would change nothing.
+        """
+        known = self._etags.get(url)
+        if known is None or known[0] != component:
+            return False
+        return self._body_digests.get(url) == (known[1], _body_digest(ical_content))
+
+    def _lazy_data(self, obj, partial=False):
+        """
+        Wraps an object's data in a LazyICal keyed by (url, etag) when the ETag is known.
+        `partial` data (only_props, or recurring events expanded to one query window) is
+        never keyed: it differs from the stored body under the same ETag.
+        """
+        url = str(obj.url)
+        known = self._etags.get(url)
+        cache_key = (url, known[1]) if known is not None and not partial else None
+        return LazyICal(obj.data, cache_key=cache_key)
+
+    async def _put(self, url: str, ical_content, component: str, if_match: str):
+        """
+        PUTs `ical_content` (str or UTF-8 bytes) to `url` guarded by `If-Match` and
+        records the new ETag.
+        Returns the HTTP status code.
+        """
+        headers = {"If-Match": if_match, "Content-Type": 'text/calendar; charset="utf-8"'}
+        # Run the synchronous call in the service's thread pool
+        response = await self._run(self.client.put, url, ical_content, headers)
+        self._forget_ctag(url)
+        new_etag = response.headers.get("ETag") if response.status in (200, 201, 204) else None
+        if new_etag:
+            self._etags[url] = (component, new_etag)
+            self._body_digests[url] = (new_etag, _body_digest(ical_content))
+        else:
+            self._etags.pop(url, None)
+        return response.status
+
+    async def _conditional_put(self, url: str, ical_content, component: str):
+        """
+        Overwrites an object with a single PUT guarded by `If-Match`, using the ETag
+        from an earlier listing. This skips fetching the object before saving it.
+
+        Returns:
+            bool: True if the PUT succeeded, False if no matching ETag is known or the
+                  server rejected it (e.g. 412 Precondition Failed), in which case
+                  the caller falls back to its own unconditional save.
+        """
+        known = self._etags.get(url)
+        if known is None or known[0] != component:
+            return False
+        status = await self._put(url, ical_content, component, known[1])
+        if status not in (200, 201, 204):
+            logger.warning("Conditional PUT to %s failed with status %s; the listed ETag is out of date, so saving without it.", url, status)
+            return False
+        return True
+
+    async def _delete_url(self, url: str, component: str):
+        """
+        Deletes an object with a bare DELETE on its URL, guarded by `If-Match` when its
+        ETag is known. Returns the HTTP status code.
+        """
+        known = self._etags.get(url)
+        headers = {"If-Match": known[1]} if known is not None and known[0] == component else {}
+        # Run the synchronous call in the service's thread pool
+        response = await self._run(self.client.request, url, "DELETE", "", headers)
+        self._etags.pop(url, None)
+        self._body_digests.pop(url, None)
+        self._forget_ctag(url)
+        return response.status
+
+    async def _delete_now(self, url: str, component: str):
+        """
+        Deletes an object with a single unconditional DELETE. Like python-caldav's own
+        delete(), an object that is already gone counts as deleted.
+        """
+        self._etags.pop(url, None) # No If-Match: delete it even if it changed since listing
+        status = await self._delete_url(url, component)
+        if status not in (200, 204, 404):
+            raise DeleteError(f"Deleting {url} failed with HTTP status {status}")
+
+    def _store_collection(self, key, ctag, items):
+        if ctag is not None:
+            self._collection_cache[key] = (ctag, time.monotonic(), items)
+
+    async def _run(self, fn, *args, **kwargs):
+        """
+        Runs a blocking call in the service's thread pool and awaits its result.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+        except CalDAVAuthorizationError:
+            self._forget_session()
+            raise
+
+    def _forget_session(self):
+        """
+        Drops the discovered principal and the cached calendar list after the server
+        rejected our credentials, so the next call connects again with fresh discovery.
+        """
+        if self._connected.is_set():
+            logger.warning("CalDAV server at %s rejected the credentials; reconnecting on next use.", self.url)
+            self._connected.clear()
+            self._calendars_cache = None
+            self._ctags.clear()
+
+    async def aclose(self):
+        """
+        Closes the pooled HTTP session, releasing its keep-alive connections, and
+        shuts down the service's thread pool.
+        """
+        for task in list(self._refreshes.values()):
+            task.cancel()
+        self._session.close()
+        self._pool.shutdown(wait=False)
 
     async def get_calendars(self):
         """
         Retrieves a list of all calendars accessible by the authenticated user.
 
+        The list is cached for `CALENDARS_CACHE_TTL` seconds, since listing costs
+        one PROPFIND plus one property lookup per calendar. After that it is served
+        stale for up to `CALENDARS_STALE_TTL` seconds while a background fetch
+        replaces it.
+
         Returns:
             list: A list of dictionaries, where each dictionary represents a calendar
                   with 'name' (display name) and 'url'.
         """
-        if not self.principal:
-            await self.connect()
+        if self._calendars_cache is not None:
+            fetched_at, cached = self._calendars_cache
+            age = time.monotonic() - fetched_at
+            if age < self._calendars_ttl:
+                logger.info("Returning %s cached calendars.", len(cached))
+                return [dict(cal) for cal in cached]
+            if age < self._calendars_stale_ttl:
+                logger.info("Returning %s cached calendars while refreshing them.", len(cached))
+                self._refresh_in_background(("calendars",), self._coalesced(("calendars",), self._fetch_calendars))
+                return [dict(cal) for cal in cached]
+
+        return await self._coalesced(("calendars",), self._fetch_calendars)
+
+    async def _fetch_calendars(self):
+        """Fetches the calendar list from the server and stores it in the cache."""
+        await self._ensure_connected()
         logger.info("Fetching calendars...")
-        # Wrap the synchronous call in asyncio.to_thread
-        calendars_raw = await asyncio.to_thread(self.principal.calendars)
+        # Run the synchronous call in the service's thread pool
+        calendars_raw = await self._run(self.principal.calendars)
+
+        # calendars() already runs a Depth:1 PROPFIND that includes the displayname,
+        # so only ask again for calendars the server returned without one.
+        missing = [cal_obj for cal_obj in calendars_raw if cal_obj.name is None]
+        # Fetch the missing names concurrently rather than one round trip after another;
+        # the service's thread pool caps how many are in flight at once.
+        fetched_names = await asyncio.gather(
+            *(self._run(cal_obj.get_property, DISPLAYNAME_PROP) for cal_obj in missing)
+        )
+        names_by_id = {id(cal_obj): name for cal_obj, name in zip(missing, fetched_names)}
 
         calendars_list = []
         for cal_obj in calendars_raw:
-            # Wrap the synchronous call in asyncio.to_thread
-            display_name = await asyncio.to_thread(cal_obj.get_property, dav.DisplayName())
+            display_name = names_by_id.get(id(cal_obj), cal_obj.name)
             calendars_list.append({"name": display_name, "url": str(cal_obj.url)})
 
-        logger.info(f"Found {len(calendars_list)} calendars.")
+        logger.info("Found %s calendars.", len(calendars_list))
+        self._calendars_cache = (time.monotonic(), calendars_list)
         return calendars_list
 
-    async def get_events(self, calendar_url: str, start_date: datetime = None, end_date: datetime = None):
+    async def get_events(self, calendar_url: str, start_date: datetime = None, end_date: datetime = None, only_props: list = None):
         """
         Retrieves events from a specified calendar within a given date range.
 
         Args:
             calendar_url (str): The URL of the calendar to fetch events from.
             start_date (datetime, optional): The start datetime for the event search.
-                                            If None, defaults to 30 days ago.
+                                            If None, defaults to 30 days before the start
+                                            of today (UTC).
             end_date (datetime, optional): The end datetime for the event search.
-                                          If None, defaults to 1 year from now.
+                                          If None, defaults to 1 year after the end of
+                                          today (UTC).
+            only_props (list, optional): iCalendar property names (e.g. ["SUMMARY"]) to
+                                         return instead of whole events. The UID, timing and
+                                         recurrence properties are always included, and
+                                         recurring events are returned unexpanded.
+
+        Fetched date windows are cached per calendar and reused for as long as the
+        calendar's CTag is unchanged; only the parts of the requested range that no
+        cached window covers are queried from the server. A window holding expanded
+        recurring events is only reused for exactly the same range.
 
         Returns:
             list: A list of dictionaries, each representing an event with its 'url'
                   and raw iCalendar 'data'.
         """
-        if not self.principal:
-            await self.connect()
-        logger.info(f"Fetching events for calendar: {calendar_url}, start: {start_date}, end: {end_date}")
+        key = ("events", calendar_url, start_date, end_date, tuple(only_props) if only_props else None)
+        return await self._coalesced(key, lambda: self._fetch_events(calendar_url, start_date, end_date, only_props))
+
+    async def _fetch_events(self, calendar_url: str, start_date: datetime = None, end_date: datetime = None, only_props: list = None):
+        """Fetches the listing for get_events(); concurrent identical calls share one run."""
+        await self._ensure_connected()
+        logger.info("Fetching events for calendar: %s, start: %s, end: %s", calendar_url, start_date, end_date)
         
-        # Get the specific calendar object by its URL
-        # Wrap the synchronous call in asyncio.to_thread
-        calendar_obj = await asyncio.to_thread(self.client.calendar, url=calendar_url)
+        # Get the specific calendar object by its URL (no I/O, so no thread hop needed)
+        calendar_obj = self._calendar(calendar_url)
         
-        # Set default date ranges if not provided
-        now = datetime.now(pytz.utc)
+        # Set default date ranges if not provided. They are snapped to whole UTC days, so
+        # repeated default listings ask for the same range and can be served from the cache.
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
         if not start_date:
-            start_date = now - timedelta(days=30) # Default: last 30 days
+            start_date = today - DEFAULT_EVENTS_PAST # Default: last 30 days
         if not end_date:
-            end_date = now + timedelta(days=365) # Default: next year
+            end_date = today + timedelta(days=1) + DEFAULT_EVENTS_FUTURE # Default: next year
 
-        # Perform a date-range search for events
-        # Wrap the synchronous call in asyncio.to_thread
-        events_raw = await asyncio.to_thread(calendar_obj.date_search, start=start_date, end=end_date)
-        
-        event_list = []
-        for event_obj in events_raw: # Renamed to avoid confusion if event was a var name
-            event_list.append({"url": str(event_obj.url), "data": event_obj.data})
-        logger.info(f"Found {len(event_list)} events for calendar: {calendar_url}.")
+        # A cheap CTag PROPFIND tells us whether the collection changed since the last fetch
+        ctag = await self._checked_ctag(calendar_url, calendar_obj)
+        window_key = (calendar_url, tuple(only_props) if only_props else None)
+        windows = self._cached_event_windows(window_key, ctag)
+
+        range_start, range_end = _as_utc(start_date), _as_utc(end_date)
+        usable = [w for w in windows if w[1] > range_start and w[0] < range_end]
+        if any(w[4] for w in usable):
+            # Expanded recurring events only hold the occurrences inside the window they
+            # were fetched for, so such windows cannot be combined or cut down to a sub-range.
+            usable = [w for w in usable if (w[0], w[1]) == (range_start, range_end)][:1]
+        missing = _missing_intervals(range_start, range_end, [(w[0], w[1]) for w in usable])
+        if missing == [(range_start, range_end)]:
+            # Nothing cached overlaps; query the range exactly as requested
+            missing = [(start_date, end_date)]
+
+        def _search_gap(gap_start, gap_end):
+            if only_props:
+                search_args = _partial_search_args(
+                    calendar_obj, "VEVENT", only_props, EVENT_BASE_PROPS, start=gap_start, end=gap_end, event=True
+                )
+            else:
+                search_args = {"start": gap_start, "end": gap_end, **EVENT_SEARCH_OPTIONS}
+            # Run the synchronous call in the service's thread pool
+            return self._run(calendar_obj.search, **search_args)
+
+        # Perform a date-range search for each uncovered part of the range
+        results = await asyncio.gather(*(_search_gap(gap_start, gap_end) for gap_start, gap_end in missing))
+        fetched_at = time.monotonic()
+        for (gap_start, gap_end), events_raw in zip(missing, results):
+            event_list = []
+            expanded = False
+            for event_obj in events_raw: # Renamed to avoid confusion if event was a var name
+                # Expanded data holds only this window's occurrences, not the stored body
+                event_expanded = not only_props and _is_expanded(event_obj.data)
+                expanded = expanded or event_expanded
+                self._remember_etag(event_obj, "VEVENT", partial=bool(only_props) or event_expanded)
+                event_list.append({
+                    "url": str(event_obj.url),
+                    "data": self._lazy_data(event_obj, partial=bool(only_props) or event_expanded)
+                })
+            window = (_as_utc(gap_start), _as_utc(gap_end), fetched_at, event_list, expanded)
+            windows.append(window)
+            usable.append(window)
+        if ctag is not None:
+            self._event_windows[window_key] = (ctag, windows[-MAX_CACHED_EVENT_WINDOWS:])
+
+        # Merge the windows that overlap the request, dropping duplicates by URL. Events
+        # from windows reaching outside the request are checked against its bounds.
+        merged = {}
+        for window_start, window_end, _, event_list, _ in usable:
+            inside = range_start <= window_start and window_end <= range_end
+            for event in event_list:
+                if event["url"] in merged:
+                    continue
+                if inside or _event_in_range(event["data"], range_start, range_end):
+                    merged[event["url"]] = dict(event)
+
+        event_list = list(merged.values())
+        if missing:
+            logger.info("Found %s events for calendar: %s.", len(event_list), calendar_url)
+        else:
+            logger.info("Calendar %s unchanged; returning %s cached events.", calendar_url, len(event_list))
         return event_list
 
+    async def get_events_multi(self, calendar_urls: list, start_date: datetime = None, end_date: datetime = None, only_props: list = None):
+        """
+        Retrieves events from several calendars concurrently. Takes the same arguments
+        as get_events(), with a list of calendar URLs.
+
+        Returns:
+            list: One dictionary per calendar, in the given order, with the 'status' of its
+                  listing ('success' or 'error'), the 'calendar_url' and either its
+                  'events' or, on error, a 'message'.
+        """
+        await self._ensure_connected()
+        outcomes = await asyncio.gather(
+            *(self.get_events(url, start_date, end_date, only_props=only_props) for url in calendar_urls),
+            return_exceptions=True
+        )
+        return [_calendar_result("events", url, outcome) for url, outcome in zip(calendar_urls, outcomes)]
+
     async def create_event(self, calendar_url: str, ical_content: str):
         """
         Creates a new event in the specified calendar using iCalendar content.
@@ -135,15 +845,43 @@ class CalDAVService:
             dict: A dictionary indicating the 'status' of the operation and the
                   'event_url' of the newly created event.
         """
-        if not self.principal:
-            await self.connect()
-        logger.info(f"Attempting to create event in calendar: {calendar_url}")
-        calendar_obj = await asyncio.to_thread(self.client.calendar, url=calendar_url)
-        # Wrap the synchronous call in asyncio.to_thread
-        event = await asyncio.to_thread(calendar_obj.save_event, ical=ical_content)
-        logger.info(f"Successfully created event: {str(event.url)} in calendar: {calendar_url}")
+        await self._ensure_connected()
+        logger.info("Attempting to create event in calendar: %s", calendar_url)
+        calendar_obj = self._calendar(calendar_url)
+        # Run the synchronous call in the service's thread pool
+        event = await self._run(calendar_obj.save_event, ical=ical_content)
+        self._forget_ctag(event.url)
+        logger.info("Successfully created event: %s in calendar: %s", str(event.url), calendar_url)
         return {"status": "success", "event_url": str(event.url)}
 
+    async def create_events(self, calendar_url: str, ical_contents: list):
+        """
+        Creates several events in the same calendar concurrently.
+
+        Args:
+            calendar_url (str): The URL of the calendar where the events will be created.
+            ical_contents (list): The full iCalendar (VCS) strings of the events.
+
+        Returns:
+            list: One dictionary per iCalendar string, in the given order, with the 'status'
+                  of its creation ('success' or 'error') and either the 'event_url' of the
+                  new event or a 'message'.
+        """
+        await self._ensure_connected()
+        logger.info("Attempting to create %s events in calendar: %s", len(ical_contents), calendar_url)
+        outcomes = await asyncio.gather(
+            *(self.create_event(calendar_url, ical_content) for ical_content in ical_contents),
+            return_exceptions=True
+        )
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error("Creating an event in calendar %s failed: %s", calendar_url, outcome)
+                results.append({"status": "error", "message": str(outcome)})
+            else:
+                results.append(outcome)
+        return results
+
     async def update_event(self, event_url: str, ical_content: str):
         """
         Updates an existing event with new iCalendar content.
@@ -152,23 +890,46 @@ class CalDAVService:
             event_url (str): The URL of the event to be updated.
             ical_content (str): The new full iCalendar (VCS) string for the event.
 
+        This is a single PUT: guarded by the event's ETag if it is known from an
+        earlier listing, and otherwise by `If-Match: *`, which only requires the
+        event to exist. The event is never fetched first. Content identical to the
+        body last seen under the known ETag sends no request at all, and the result
+        then carries 'cached': True.
+
+        If the server rejects the known ETag, someone else changed the event since
+        it was listed; a PutError is raised rather than overwriting their change.
+
         Returns:
             dict: A dictionary indicating the 'status' of the operation and the
                   'event_url' of the updated event.
         """
-        if not self.principal:
-            await self.connect()
-        logger.info(f"Attempting to update event at URL: {event_url}")
-        event_obj = await asyncio.to_thread(self.client.event, url=event_url)
-        event_obj.data = ical_content # This is a local assignment
-        # Wrap the synchronous call in asyncio.to_thread
-        await asyncio.to_thread(event_obj.save)
-        logger.info(f"Successfully updated event: {str(event_obj.url)}") # Use event_obj.url
-        return {"status": "success", "event_url": str(event_obj.url)} # Use event_obj.url
+        await self._ensure_connected()
+        logger.info("Attempting to update event at URL: %s", event_url)
+        body = _as_bytes(ical_content) # Encoded once for both the digest and the PUT
+        if self._is_unchanged(event_url, body, "VEVENT"):
+            logger.info("Event %s already has this content; skipping the PUT.", event_url)
+            return {"status": "success", "event_url": event_url, "cached": True}
+        known = self._etags.get(event_url)
+        if known is not None and known[0] == "VEVENT":
+            status = await self._put(event_url, body, "VEVENT", known[1])
+            if status == 412:
+                logger.error("Event %s changed on the server since it was listed; not overwriting it.", event_url)
+                raise PutError(f"Event {event_url} was changed on the server since it was listed; list it again before updating")
+        else:
+            # No known ETag: overwrite the event as stored, as long as it exists
+            status = await self._put(event_url, body, "VEVENT", "*")
+            if status == 412:
+                logger.error("Event not found at URL: %s", event_url)
+                raise NotFoundError(f"Event not found at URL: {event_url}")
+        if status not in (200, 201, 204):
+            raise PutError(f"Updating event {event_url} failed with HTTP status {status}")
+        logger.info("Successfully updated event: %s", event_url)
+        return {"status": "success", "event_url": event_url}
 
     async def delete_event(self, event_url: str):
         """
-        Deletes an event from the CalDAV server.
+        Deletes an event from the CalDAV server with a single DELETE on its URL;
+        the event is not fetched first.
 
         Args:
             event_url (str): The URL of the event to be deleted.
@@ -177,60 +938,112 @@ class CalDAVService:
             dict: A dictionary indicating the 'status' of the operation and the
                   'event_url' that was deleted.
         """
-        if not self.principal:
-            await self.connect()
-        logger.info(f"Attempting to delete event at URL: {event_url}")
-        event_obj = await asyncio.to_thread(self.client.event, url=event_url)
-        # Wrap the synchronous call in asyncio.to_thread
-        await asyncio.to_thread(event_obj.delete)
-        logger.info(f"Successfully deleted event: {event_url}")
+        await self._ensure_connected()
+        logger.info("Attempting to delete event at URL: %s", event_url)
+        await self._delete_now(event_url, "VEVENT")
+        logger.info("Successfully deleted event: %s", event_url)
         return {"status": "success", "event_url": event_url}
 
+    async def delete_events(self, event_urls: list):
+        """
+        Deletes several events concurrently. Each event costs a single DELETE on its
+        URL; the events are not fetched first.
+
+        Args:
+            event_urls (list): The URLs of the events to be deleted.
+
+        Returns:
+            list: One dictionary per URL, in the given order, with the 'status' of its
+                  deletion ('success' or 'error'), the 'event_url' and, on error, a 'message'.
+        """
+        await self._ensure_connected()
+        logger.info("Attempting to delete %s events", len(event_urls))
+        outcomes = await asyncio.gather(
+            *(self._delete_url(url, "VEVENT") for url in event_urls), return_exceptions=True
+        )
+        results = [_batch_result("event_url", url, outcome) for url, outcome in zip(event_urls, outcomes)]
+        deleted = sum(1 for result in results if result["status"] == "success")
+        logger.info("Deleted %s of %s events.", deleted, len(event_urls))
+        return results
+
     # --- Task (VTODO) Specific Methods ---
 
-    async def get_tasks(self, calendar_url: str, include_completed: bool = False):
+    async def get_tasks(self, calendar_url: str, include_completed: bool = False, only_props: list = None):
         """
         Retrieves tasks (VTODOs) from a specified calendar.
 
         Args:
             calendar_url (str): The URL of the calendar to fetch tasks from.
             include_completed (bool): Whether to include completed tasks. Defaults to False.
+            only_props (list, optional): iCalendar property names (e.g. ["SUMMARY"]) to
+                                         return instead of whole tasks. UID, STATUS,
+                                         COMPLETED, DUE and PRIORITY are always included.
+
+        Results are cached per calendar and reused for as long as the calendar's
+        CTag is unchanged.
 
         Returns:
             list: A list of dictionaries, each representing a task with its 'url'
                   and raw iCalendar 'data'.
         """
-        if not self.principal:
-            await self.connect()
-        logger.info(f"Fetching tasks for calendar: {calendar_url}, include_completed: {include_completed}")
+        key = ("tasks", calendar_url, include_completed, tuple(only_props) if only_props else None)
+        return await self._coalesced(key, lambda: self._fetch_tasks(calendar_url, include_completed, only_props))
+
+    async def _fetch_tasks(self, calendar_url: str, include_completed: bool = False, only_props: list = None):
+        """Fetches the listing for get_tasks(); concurrent identical calls share one run."""
+        await self._ensure_connected()
+        logger.info("Fetching tasks for calendar: %s, include_completed: %s", calendar_url, include_completed)
         
-        # Wrap the synchronous call in asyncio.to_thread
-        calendar_obj = await asyncio.to_thread(self.client.calendar, url=calendar_url)
-        # Wrap the synchronous call in asyncio.to_thread
-        tasks_raw = await asyncio.to_thread(calendar_obj.todos)
+        # Building the calendar handle does no I/O, so no thread hop needed
+        calendar_obj = self._calendar(calendar_url)
+
+        cache_key = ("tasks", calendar_url, include_completed, tuple(only_props) if only_props else None)
+        ctag = await self._checked_ctag(calendar_url, calendar_obj)
+        cached = self._cached_collection(cache_key, ctag)
+        if cached is not None:
+            logger.info("Calendar %s unchanged; returning %s cached tasks.", calendar_url, len(cached))
+            return cached
+        # A single REPORT that also returns ETags. The server drops tasks with a COMPLETED
+        # date; the STATUS check below catches the rest.
+        search_args = _task_search_args(calendar_obj, include_completed, only_props)
+        # Run the synchronous call in the service's thread pool
+        tasks_raw = await self._run(calendar_obj.search, **search_args)
 
         task_list = []
         for task_obj in tasks_raw: # task_obj is a caldav Task object
             if not include_completed:
-                try:
-                    cal = Calendar.from_ical(task_obj.data)
-                    is_completed = False
-                    for component in cal.walk():
-                        if component.name == 'VTODO':
-                            status = component.get('status')
-                            if status and str(status).upper() == 'COMPLETED':
-                                is_completed = True
-                                break # Found VTODO and it's completed
-                    if is_completed:
-                        continue # Skip this task
-                except ValueError:
-                    logger.warning(f"Could not parse task data for URL {task_obj.url}. Skipping.", exc_info=True)
-                    pass # Skip tasks that can't be parsed if filtering for completed status
-
-            task_list.append({"url": str(task_obj.url), "data": task_obj.data})
-        logger.info(f"Found {len(task_list)} tasks for calendar: {calendar_url}.")
+                # A single pass over the raw bytes for the STATUS line is enough here;
+                # parsing the whole VCALENDAR with icalendar just to read one property
+                # is far slower, and neither scan copies the data.
+                if not _is_vtodo(task_obj.data):
+                    logger.warning("Could not parse task data for URL %s. Skipping.", task_obj.url)
+                    continue # Skip tasks that can't be parsed if filtering for completed status
+                if _is_completed(task_obj.data):
+                    continue # Skip this task
+
+            self._remember_etag(task_obj, "VTODO", partial=bool(only_props))
+            task_list.append({"url": str(task_obj.url), "data": self._lazy_data(task_obj, partial=bool(only_props))})
+        logger.info("Found %s tasks for calendar: %s.", len(task_list), calendar_url)
+        self._store_collection(cache_key, ctag, task_list)
         return task_list
 
+    async def get_tasks_multi(self, calendar_urls: list, include_completed: bool = False, only_props: list = None):
+        """
+        Retrieves tasks (VTODOs) from several calendars concurrently. Takes the same
+        arguments as get_tasks(), with a list of calendar URLs.
+
+        Returns:
+            list: One dictionary per calendar, in the given order, with the 'status' of its
+                  listing ('success' or 'error'), the 'calendar_url' and either its
+                  'tasks' or, on error, a 'message'.
+        """
+        await self._ensure_connected()
+        outcomes = await asyncio.gather(
+            *(self.get_tasks(url, include_completed, only_props=only_props) for url in calendar_urls),
+            return_exceptions=True
+        )
+        return [_calendar_result("tasks", url, outcome) for url, outcome in zip(calendar_urls, outcomes)]
+
     async def create_task(self, calendar_url: str, ical_content: str):
         """
         Creates a new task (VTODO) in the specified calendar using iCalendar content.
@@ -243,14 +1056,14 @@ class CalDAVService:
             dict: A dictionary indicating the 'status' of the operation and the
                   'task_url' of the newly created task.
         """
-        if not self.principal:
-            await self.connect()
-        logger.info(f"Attempting to create task in calendar: {calendar_url}")
-        calendar_obj = await asyncio.to_thread(self.client.calendar, url=calendar_url)
+        await self._ensure_connected()
+        logger.info("Attempting to create task in calendar: %s", calendar_url)
+        calendar_obj = self._calendar(calendar_url)
         # The save_todo method is typically used for VTODOs
-        # Wrap the synchronous call in asyncio.to_thread
-        task = await asyncio.to_thread(calendar_obj.save_todo, ical=ical_content)
-        logger.info(f"Successfully created task: {str(task.url)} in calendar: {calendar_url}")
+        # Run the synchronous call in the service's thread pool
+        task = await self._run(calendar_obj.save_todo, ical=ical_content)
+        self._forget_ctag(task.url)
+        logger.info("Successfully created task: %s in calendar: %s", str(task.url), calendar_url)
         return {"status": "success", "task_url": str(task.url)}
 
     async def update_task(self, task_url: str, ical_content: str):
@@ -261,37 +1074,52 @@ class CalDAVService:
             task_url (str): The URL of the task to be updated.
             ical_content (str): The new full iCalendar (VCS) string for the task.
 
+        If the task's ETag is known from an earlier listing, it is already known to be
+        a VTODO and the update is a single conditional PUT, or no request at all when
+        the content is identical to the body last seen under that ETag ('cached': True).
+
         Returns:
             dict: A dictionary indicating the 'status' of the operation and the
                   'task_url' of the updated task.
         """
-        if not self.principal:
-            await self.connect()
-        logger.info(f"Attempting to update task at URL: {task_url}")
+        await self._ensure_connected()
+        logger.info("Attempting to update task at URL: %s", task_url)
+        body = _as_bytes(ical_content) # Encoded once for both the digest and the PUT
+        if self._is_unchanged(task_url, body, "VTODO"):
+            logger.info("Task %s already has this content; skipping the PUT.", task_url)
+            return {"status": "success", "task_url": task_url, "cached": True}
+        if await self._conditional_put(task_url, body, "VTODO"):
+            logger.info("Successfully updated task: %s", task_url)
+            return {"status": "success", "task_url": task_url}
         # Fetch the object by URL
-        task_obj = await asyncio.to_thread(self.client.object_by_url, url=task_url)
+        task_obj = await self._run(self.client.object_by_url, url=task_url)
 
         # Check if the task object was found
         if task_obj is None:
-            logger.error(f"Task not found at URL: {task_url}")
+            logger.error("Task not found at URL: %s", task_url)
             raise ValueError(f"Task not found at URL: {task_url}")
 
-        # Check if the fetched object is a VTODO task
-        # Accessing the iCalendar component name, common in caldav libraries
-        if not hasattr(task_obj, 'obj') or task_obj.obj.name != "VTODO":
-            logger.error(f"Object at URL {task_url} is not a VTODO task. Object: {task_obj}")
+        # Check if the fetched object is a VTODO task. A byte scan of the raw data is
+        # enough, and avoids the full iCalendar parse that task_obj.obj would trigger.
+        if not _is_vtodo(getattr(task_obj, 'data', None)):
+            logger.error("Object at URL %s is not a VTODO task. Object: %s", task_url, task_obj)
             raise ValueError(f"Object at URL {task_obj.url if hasattr(task_obj, 'url') else task_url} is not a VTODO task.")
 
         task_obj.data = ical_content # Local assignment
-        # Wrap the synchronous call in asyncio.to_thread
-        await asyncio.to_thread(task_obj.save)
-        logger.info(f"Successfully updated task: {str(task_obj.url)}") # Use task_obj.url
+        # Run the synchronous call in the service's thread pool
+        await self._run(task_obj.save)
+        self._etags.pop(task_url, None) # The save changed the ETag and we did not get the new one
+        self._forget_ctag(task_url)
+        logger.info("Successfully updated task: %s", str(task_obj.url)) # Use task_obj.url
         return {"status": "success", "task_url": str(task_obj.url)} # Use task_obj.url
 
     async def delete_task(self, task_url: str):
         """
         Deletes a task (VTODO) from the CalDAV server.
 
+        A task already known to be a VTODO from an earlier get_tasks() call is deleted
+        with a single DELETE; any other URL is fetched and checked first.
+
         Args:
             task_url (str): The URL of the task to be deleted.
 
@@ -299,23 +1127,59 @@ class CalDAVService:
             dict: A dictionary indicating the 'status' of the operation and the
                   'task_url' that was deleted.
         """
-        if not self.principal:
-            await self.connect()
-        logger.info(f"Attempting to delete task at URL: {task_url}")
+        await self._ensure_connected()
+        logger.info("Attempting to delete task at URL: %s", task_url)
+        known = self._etags.get(task_url)
+        if known is not None and known[0] == "VTODO":
+            await self._delete_now(task_url, "VTODO")
+            logger.info("Successfully deleted task: %s", task_url)
+            return {"status": "success", "task_url": task_url}
         # Fetch the object by URL
-        task_obj = await asyncio.to_thread(self.client.object_by_url, url=task_url)
+        task_obj = await self._run(self.client.object_by_url, url=task_url)
 
         # Check if the task object was found
         if task_obj is None:
-            logger.error(f"Task not found at URL: {task_url}")
+            logger.error("Task not found at URL: %s", task_url)
             raise ValueError(f"Task not found at URL: {task_url}")
 
-        # Check if the fetched object is a VTODO task
-        if not hasattr(task_obj, 'obj') or task_obj.obj.name != "VTODO":
-            logger.error(f"Object at URL {task_url} is not a VTODO task. Object: {task_obj}")
+        # Check if the fetched object is a VTODO task. A byte scan of the raw data is
+        # enough, and avoids the full iCalendar parse that task_obj.obj would trigger.
+        if not _is_vtodo(getattr(task_obj, 'data', None)):
+            logger.error("Object at URL %s is not a VTODO task. Object: %s", task_url, task_obj)
             raise ValueError(f"Object at URL {task_obj.url if hasattr(task_obj, 'url') else task_url} is not a VTODO task.")
 
-        # Wrap the synchronous call in asyncio.to_thread
-        await asyncio.to_thread(task_obj.delete)
-        logger.info(f"Successfully deleted task: {task_url}")
-        return {"status": "success", "task_url": task_url}
\ No newline at end of file
+        # Run the synchronous call in the service's thread pool
+        await self._run(task_obj.delete)
+        self._etags.pop(task_url, None)
+        self._forget_ctag(task_url)
+        logger.info("Successfully deleted task: %s", task_url)
+        return {"status": "success", "task_url": task_url}
+
+    async def delete_tasks(self, task_urls: list):
+        """
+        Deletes several tasks (VTODOs) concurrently. Tasks already known to be VTODOs
+        from an earlier get_tasks() call are deleted with a single DELETE; any other URL
+        goes through delete_task() so it is checked before being deleted.
+
+        Args:
+            task_urls (list): The URLs of the tasks to be deleted.
+
+        Returns:
+            list: One dictionary per URL, in the given order, with the 'status' of its
+                  deletion ('success' or 'error'), the 'task_url' and, on error, a 'message'.
+        """
+        await self._ensure_connected()
+        logger.info("Attempting to delete %s tasks", len(task_urls))
+
+        async def _delete_one(url):
+            known = self._etags.get(url)
+            if known is not None and known[0] == "VTODO":
+                return await self._delete_url(url, "VTODO")
+            await self.delete_task(url)
+            return 204
+
+        outcomes = await asyncio.gather(*(_delete_one(url) for url in task_urls), return_exceptions=True)
+        results = [_batch_result("task_url", url, outcome) for url, outcome in zip(task_urls, outcomes)]
+        deleted = sum(1 for result in results if result["status"] == "success")
+        logger.info("Deleted %s of %s tasks.", deleted, len(task_urls))
+        return results
@@ -1,61 +1,262 @@
 import os
+import re
+import asyncio
+import functools
+import inspect
+from time import monotonic
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP # Import FastMCP for building the MCP server
 from caldav_service import CalDAVService, CalDAVConnectionError # Import our CalDAV service logic
 import json # For parsing CALDAV_ACCOUNTS
-from datetime import datetime
-import pytz # Import pytz for timezone handling
+import requests # For the network errors raised by CalDAV requests
+try:
+    # orjson parses natively and raises a json.JSONDecodeError subclass; optional
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+from datetime import datetime, date, time, timezone
 from icalendar import Calendar # For iCalendar parsing
 import logging
-
-# Configure basic logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-    handlers=[logging.StreamHandler()] # Log to stdout
-)
-logger = logging.getLogger(__name__)
+import queue
+import sys
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 
 # Load environment variables from a .env file.
 # This allows sensitive information (like URLs, usernames, passwords)
 # to be kept out of the codebase and managed securely.
 load_dotenv()
 
+# Configure logging. Records are handed to a queue and written to stderr by a
+# background listener thread, so logging never blocks the event loop and never
+# touches stdout, which the MCP stdio transport uses for protocol messages.
+_log_queue = queue.SimpleQueue()
+_log_handler = QueueHandler(_log_queue)
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+_stderr_handler = logging.StreamHandler(sys.stderr)
+_stderr_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _stderr_handler)
+# Per-call INFO records are opt-in (LOG_LEVEL=INFO); by default only problems are logged.
+_log_level = os.getenv("LOG_LEVEL", "WARNING").upper()
+if not isinstance(logging.getLevelName(_log_level), int):
+    _log_level = "WARNING" # Unknown level names fall back to the default
+logging.basicConfig(level=_log_level, handlers=[_log_handler])
+if _log_handler in logging.getLogger().handlers:
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+logger = logging.getLogger(__name__)
+
+# Size of the thread pool each CalDAV account uses for its blocking calls.
+# Every account gets its own pool, so a slow server cannot starve the others.
+try:
+    CALDAV_THREAD_POOL_SIZE = int(os.getenv("CALDAV_THREAD_POOL_SIZE", "16"))
+except ValueError:
+    logger.error("CALDAV_THREAD_POOL_SIZE is not an integer. Using the default of 16.")
+    CALDAV_THREAD_POOL_SIZE = 16
+
+# Largest iCalendar payload, in characters, that the write tools accept (default 1 MiB).
+# Bigger payloads are rejected before they are scanned, parsed or uploaded.
+try:
+    CALDAV_MAX_ICAL_SIZE = int(os.getenv("CALDAV_MAX_ICAL_SIZE", "1048576"))
+except ValueError:
+    logger.error("CALDAV_MAX_ICAL_SIZE is not an integer. Using the default of 1048576.")
+    CALDAV_MAX_ICAL_SIZE = 1048576
+
+# Opt-in circuit breaker: after this many consecutive connection errors for one
+# account, its tools fail fast for CALDAV_BREAKER_COOLDOWN seconds instead of
+# waiting on a server that is down. 0 (the default) disables it.
+try:
+    CALDAV_BREAKER_THRESHOLD = int(os.getenv("CALDAV_BREAKER_THRESHOLD", "0"))
+    CALDAV_BREAKER_COOLDOWN = float(os.getenv("CALDAV_BREAKER_COOLDOWN", "30"))
+except ValueError:
+    logger.error("CALDAV_BREAKER_THRESHOLD/CALDAV_BREAKER_COOLDOWN are not numbers. Disabling the circuit breaker.")
+    CALDAV_BREAKER_THRESHOLD, CALDAV_BREAKER_COOLDOWN = 0, 30.0
+
+# account_identifier -> [consecutive connection errors, monotonic time the breaker opened or None]
+_breakers: dict[str, list] = {}
+# Errors that count towards the breaker. Only connect() wraps network failures in
+# CalDAVConnectionError; requests made later raise the requests exceptions as they are.
+_CONNECTION_ERRORS = (CalDAVConnectionError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+def _record_connection_error(account_identifier: str):
+    """Counts a connection error for the account and opens its breaker at the threshold."""
+    if CALDAV_BREAKER_THRESHOLD <= 0:
+        return
+    breaker = _breakers.setdefault(account_identifier, [0, None])
+    breaker[0] += 1
+    if breaker[0] >= CALDAV_BREAKER_THRESHOLD:
+        breaker[1] = monotonic()
+        logger.warning("Circuit breaker open for account %s after %s connection errors.", account_identifier, breaker[0])
+
+
+def _tool_errors(container: type):
+    """
+    Decorates a tool declared as `fn(account_identifier, service, ...)`: the wrapper
+    looks up the account's CalDAVService and passes it in, and the tool is exposed
+    without the `service` parameter. Unknown accounts, connection errors and
+    unexpected exceptions are logged and returned as an error structure, a dict or a
+    one-element list depending on `container`. While the account's circuit breaker is
+    open the tool fails fast; after the cooldown one call is let through as a probe.
+    """
+    def decorator(fn):
+        tool_name = fn.__name__
+        signature = inspect.signature(fn)
+
+        def error(message: str):
+            result = {"status": "error", "message": message}
+            return [result] if container is list else result
+
+        @functools.wraps(fn)
+        async def wrapper(account_identifier, *args, **kwargs):
+            service = caldav_services_map.get(account_identifier)
+            if service is None:
+                logger.error("Account identifier '%s' not found in configured services for '%s'.", account_identifier, tool_name)
+                return error(f"Account identifier '{account_identifier}' not found.")
+            breaker = _breakers.get(account_identifier)
+            if breaker is not None and breaker[1] is not None:
+                if monotonic() - breaker[1] < CALDAV_BREAKER_COOLDOWN:
+                    logger.warning("Circuit breaker open for account %s; failing '%s' fast.", account_identifier, tool_name)
+                    return error(f"CalDAV server for account {account_identifier} is unavailable; retry later.")
+                breaker[1] = monotonic() # Half-open: this call probes, others keep failing fast
+            try:
+                result = await fn(account_identifier, service, *args, **kwargs)
+            except _CONNECTION_ERRORS as e:
+                logger.error("CalDAV connection error for account %s in '%s': %s", account_identifier, tool_name, e)
+                _record_connection_error(account_identifier)
+                return error(f"CalDAV connection error for account {account_identifier}: {e}")
+            except Exception as e:
+                # Tracebacks are formatted on the calling thread, so only at DEBUG level
+                logger.error("An unexpected error occurred for account %s in '%s': %s", account_identifier, tool_name, e)
+                logger.debug("Traceback of the error in '%s':", tool_name, exc_info=True)
+                return error(f"An unexpected error occurred for account {account_identifier}: {e}")
+            _breakers.pop(account_identifier, None)
+            return result
+        # The tool schema is built from the signature, which must not expose `service`
+        wrapper.__signature__ = signature.replace(
+            parameters=[param for name, param in signature.parameters.items() if name != "service"]
+        )
+        return wrapper
+    return decorator
+
+
+def _parse_date(value: str):
+    """
+    Turns a 'YYYY-MM-DD' tool argument into midnight UTC, or None if it is empty.
+    date.fromisoformat() is C-implemented and much faster than strptime().
+    """
+    if not value:
+        return None
+    return datetime.combine(date.fromisoformat(value), time(), tzinfo=timezone.utc)
+
+
+# Line scans used to accept well-formed iCalendar without a full parse: component
+# markers, and any line that is neither a folded continuation nor a NAME[;params]: line.
+ICAL_MARKER = re.compile(r"^(BEGIN|END):([A-Za-z0-9-]+)[ \t]*\r?$", re.MULTILINE)
+ICAL_BAD_LINE = re.compile(r"^(?![ \t\r]|[A-Za-z0-9-]+[;:]).", re.MULTILINE)
+
+
+def _is_well_formed(ical_content: str, component: str) -> bool:
+    """
+    Checks in one pass that `ical_content` is a single VCALENDAR with balanced
+    BEGIN/END markers, property lines only, and at least one `component` in it.
+    """
+    if ICAL_BAD_LINE.search(ical_content):
+        return False
+    stack = []
+    calendars = 0
+    found = False
+    for marker in ICAL_MARKER.finditer(ical_content):
+        kind, name = marker.group(1), marker.group(2).upper()
+        if kind == "BEGIN":
+            if not stack:
+                calendars += 1
+                if name != "VCALENDAR" or calendars > 1:
+                    return False
+            stack.append(name)
+            found = found or (name == component and len(stack) == 2)
+        elif not stack or stack.pop() != name:
+            return False
+    return found and not stack
+
+
+def _ical_error(ical_content: str, component: str):
+    """
+    Returns why `ical_content` is not valid iCalendar, or None if it is. Oversized
+    content is rejected before any scan. Well-formed content is accepted without
+    building a component tree; anything else goes through the full icalendar parser,
+    which has the final say and a precise message.
+    """
+    if len(ical_content) > CALDAV_MAX_ICAL_SIZE:
+        return f"content is larger than {CALDAV_MAX_ICAL_SIZE} characters"
+    if _is_well_formed(ical_content, component):
+        return None
+    try:
+        Calendar.from_ical(ical_content)
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+@asynccontextmanager
+async def app_lifespan(server: FastMCP):
+    """
+    Closes the CalDAV services' HTTP sessions and thread pools on shutdown.
+    """
+    try:
+        yield {}
+    finally:
+        await asyncio.gather(
+            *(service.aclose() for service in caldav_services_map.values()),
+            return_exceptions=True
+        )
+
+
 # Instantiate an MCP server client.
 # This names our server, which will be visible to tools that interact with it.
-mcp = FastMCP("CalDAV Nextcloud Integration")
+mcp = FastMCP("CalDAV Nextcloud Integration", lifespan=app_lifespan)
+
+def _init_caldav_services_map(accounts_json: str) -> dict:
+    """
+    Builds the account URL -> CalDAVService map from a CALDAV_ACCOUNTS JSON string.
+    Invalid entries are skipped and unparsable input yields an empty map; both are logged.
+    """
+    services_map: dict[str, CalDAVService] = {}
+    try:
+        accounts_config = _json_loads(accounts_json)
+        if not isinstance(accounts_config, list):
+            logger.error("CALDAV_ACCOUNTS is not a list. Initializing with no accounts.")
+            accounts_config = []
+
+        for account in accounts_config:
+            if isinstance(account, dict) and "url" in account and "username" in account and "password" in account:
+                service = CalDAVService(
+                    url=account["url"],
+                    username=account["username"],
+                    password=account["password"],
+                    max_workers=CALDAV_THREAD_POOL_SIZE
+                )
+                if account["url"] in services_map:
+                    logger.warning("Duplicate CalDAV account URL found: %s. Overwriting previous entry.", account['url'])
+                services_map[account["url"]] = service
+                logger.info("Successfully initialized CalDAV service for account URL: %s", account['url'])
+            else:
+                logger.error("Invalid account configuration found: %s. Skipping.", account)
+    except json.JSONDecodeError as e:
+        logger.error("Failed to parse CALDAV_ACCOUNTS JSON: %s. Initializing with no accounts.", e)
+        services_map = {} # Ensure it's empty on error
+    except Exception as e:
+        logger.error("An unexpected error occurred during CalDAV services initialization: %s. Initializing with no accounts.", e)
+        services_map = {} # Ensure it's empty on error
+
+    if not services_map:
+        logger.warning("No CalDAV accounts configured or all configurations failed. CalDAV tools may not function as expected.")
+    return services_map
 
-# Initialize CalDAVService instances from CALDAV_ACCOUNTS environment variable
-caldav_services_map: dict[str, CalDAVService] = {}
-try:
-    accounts_json = os.getenv("CALDAV_ACCOUNTS", "[]")
-    accounts_config = json.loads(accounts_json)
-    if not isinstance(accounts_config, list):
-        logger.error("CALDAV_ACCOUNTS is not a list. Initializing with no accounts.")
-        accounts_config = []
-
-    for account in accounts_config:
-        if isinstance(account, dict) and "url" in account and "username" in account and "password" in account:
-            service = CalDAVService(
-                url=account["url"],
-                username=account["username"],
-                password=account["password"]
-            )
-            if account["url"] in caldav_services_map:
-                logger.warning(f"Duplicate CalDAV account URL found: {account['url']}. Overwriting previous entry.")
-            caldav_services_map[account["url"]] = service
-            logger.info(f"Successfully initialized CalDAV service for account URL: {account['url']}")
-        else:
-            logger.error(f"Invalid account configuration found: {account}. Skipping.")
-except json.JSONDecodeError as e:
-    logger.error(f"Failed to parse CALDAV_ACCOUNTS JSON: {str(e)}. Initializing with no accounts.")
-    caldav_services_map = {} # Ensure it's empty on error
-except Exception as e:
-    logger.error(f"An unexpected error occurred during CalDAV services initialization: {str(e)}. Initializing with no accounts.")
-    caldav_services_map = {} # Ensure it's empty on error
 
-if not caldav_services_map:
-    logger.warning("No CalDAV accounts configured or all configurations failed. CalDAV tools may not function as expected.")
+# Initialize CalDAVService instances from CALDAV_ACCOUNTS environment variable
+caldav_services_map: dict[str, CalDAVService] = _init_caldav_services_map(os.getenv("CALDAV_ACCOUNTS", "[]"))
 
 # --- MCP Tool Definitions using @mcp.tool() decorators ---
 # Each function decorated with @mcp.tool() becomes an accessible tool
@@ -84,21 +285,28 @@ async def list_caldav_calendars() -> list:
         logger.warning("No CalDAV accounts configured. Returning empty list for calendars.")
         return []
 
-    all_calendars = []
-    for account_url, service_instance in caldav_services_map.items():
+    async def _list_account_calendars(account_url: str, service_instance: CalDAVService) -> list:
         try:
-            logger.info(f"Fetching calendars for account: {account_url}")
+            logger.info("Fetching calendars for account: %s", account_url)
             calendars = await service_instance.get_calendars()
             for calendar in calendars:
                 calendar['account_identifier'] = account_url # Add account identifier
-            all_calendars.extend(calendars)
-            logger.info(f"Successfully listed {len(calendars)} calendars for account: {account_url}")
+            logger.info("Successfully listed %s calendars for account: %s", len(calendars), account_url)
+            return calendars
         except CalDAVConnectionError as e:
-            logger.error(f"CalDAV connection error for account {account_url} in 'list_caldav_calendars': {str(e)}")
+            logger.error("CalDAV connection error for account %s in 'list_caldav_calendars': %s", account_url, e)
             # Optionally, include error information in the response if needed, for now, just log and continue.
         except Exception as e:
-            logger.exception(f"An unexpected error occurred for account {account_url} in 'list_caldav_calendars'")
+            logger.error("An unexpected error occurred for account %s in 'list_caldav_calendars': %s", account_url, e)
+            logger.debug("Traceback of the error in 'list_caldav_calendars':", exc_info=True)
             # Optionally, include error information for this account.
+        return []
+
+    # Query all accounts concurrently; results keep the configured account order.
+    per_account = await asyncio.gather(
+        *(_list_account_calendars(url, svc) for url, svc in caldav_services_map.items())
+    )
+    all_calendars = [calendar for calendars in per_account for calendar in calendars]
 
     if not all_calendars:
         logger.info("No calendars found across all configured accounts.")
@@ -106,7 +314,8 @@ async def list_caldav_calendars() -> list:
 
 
 @mcp.tool()
-async def list_caldav_events(account_identifier: str, calendar_url: str, start_date: str = None, end_date: str = None) -> list:
+@_tool_errors(list)
+async def list_caldav_events(account_identifier: str, service: CalDAVService, calendar_url: str, start_date: str = None, end_date: str = None, only_props: list[str] = None) -> list:
     """
     Lists events from a specified CalDAV calendar of a specific account, within an optional date range.
 
@@ -118,6 +327,10 @@ async def list_caldav_events(account_identifier: str, calendar_url: str, start_d
                                     If not provided, defaults to 30 days ago from the current date.
         end_date (str, optional): The end date for the event search in 'YYYY-MM-DD' format.
                                   If not provided, defaults to 1 year from the current date.
+        only_props (list[str], optional): iCalendar property names (e.g. ["SUMMARY", "LOCATION"])
+                                          to return instead of whole events, which keeps large
+                                          listings small. UID, timing and recurrence properties
+                                          are always included; recurring events are not expanded.
 
     Returns:
         list: A list of dictionaries, each representing an event with its 'url'
@@ -126,34 +339,49 @@ async def list_caldav_events(account_identifier: str, calendar_url: str, start_d
               Returns an error structure if the account_identifier is invalid.
               Example: [{"url": "https://.../event1.ics", "data": "BEGIN:VCALENDAR..."}]
     """
-    logger.info(f"Tool 'list_caldav_events' called for account: {account_identifier}, calendar: {calendar_url}, start: {start_date}, end: {end_date}")
-    service = caldav_services_map.get(account_identifier)
-    if not service:
-        logger.error(f"Account identifier '{account_identifier}' not found in configured services for 'list_caldav_events'.")
-        return [{"status": "error", "message": f"Account identifier '{account_identifier}' not found."}]
+    logger.info("Tool 'list_caldav_events' called for account: %s, calendar: %s, start: %s, end: %s", account_identifier, calendar_url, start_date, end_date)
+    s_date_obj = _parse_date(start_date)
+    e_date_obj = _parse_date(end_date)
 
-    s_date_obj = None
-    if start_date:
-        s_date_obj = datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=pytz.UTC)
+    result = await service.get_events(calendar_url, s_date_obj, e_date_obj, only_props=only_props)
+    logger.info("Successfully listed events for account %s, calendar: %s.", account_identifier, calendar_url)
+    return result
 
-    e_date_obj = None
-    if end_date:
-        e_date_obj = datetime.strptime(end_date, '%Y-%m-%d').replace(tzinfo=pytz.UTC)
 
-    try:
-        result = await service.get_events(calendar_url, s_date_obj, e_date_obj)
-        logger.info(f"Successfully listed events for account {account_identifier}, calendar: {calendar_url}.")
-        return result
-    except CalDAVConnectionError as e:
-        logger.error(f"CalDAV connection error for account {account_identifier} in 'list_caldav_events' for calendar {calendar_url}: {str(e)}")
-        return [{"status": "error", "message": f"CalDAV connection error for account {account_identifier}: {str(e)}"}]
-    except Exception as e:
-        logger.exception(f"An unexpected error occurred for account {account_identifier} in 'list_caldav_events' for calendar {calendar_url}")
-        return [{"status": "error", "message": f"An unexpected error occurred for account {account_identifier}: {str(e)}"}]
+@mcp.tool()
+@_tool_errors(list)
+async def list_caldav_events_multi(account_identifier: str, service: CalDAVService, calendar_urls: list[str], start_date: str = None, end_date: str = None, only_props: list[str] = None) -> list:
+    """
+    Lists events from several calendars of a specific account in one call.
+
+    The calendars are queried concurrently, so this is much faster than calling
+    `list_caldav_events` once per calendar.
+
+    Args:
+        account_identifier (str): The URL of the CalDAV account (serves as its identifier).
+        calendar_urls (list[str]): The absolute URLs of the calendars to query events from.
+        start_date (str, optional): As for `list_caldav_events`.
+        end_date (str, optional): As for `list_caldav_events`.
+        only_props (list[str], optional): As for `list_caldav_events`.
+
+    Returns:
+        list: One dictionary per calendar URL with the 'status' of its listing
+              ('success' or 'error'), the 'calendar_url' and its 'events';
+              failed entries carry a 'message' instead of 'events'.
+              Returns an error structure if the account_identifier is invalid.
+    """
+    logger.info("Tool 'list_caldav_events_multi' called for account: %s, calendars: %s, start: %s, end: %s", account_identifier, len(calendar_urls), start_date, end_date)
+    s_date_obj = _parse_date(start_date)
+    e_date_obj = _parse_date(end_date)
+
+    result = await service.get_events_multi(calendar_urls, s_date_obj, e_date_obj, only_props=only_props)
+    logger.info("Listed events of %s calendars for account %s.", len(calendar_urls), account_identifier)
+    return result
 
 
 @mcp.tool()
-async def create_caldav_event(account_identifier: str, calendar_url: str, ical_content: str) -> dict:
+@_tool_errors(dict)
+async def create_caldav_event(account_identifier: str, service: CalDAVService, calendar_url: str, ical_content: str) -> dict:
     """
     Creates a new event in the specified CalDAV calendar of a specific account using iCalendar (VCS) content.
 
@@ -167,31 +395,57 @@ async def create_caldav_event(account_identifier: str, calendar_url: str, ical_c
               and the 'event_url' of the newly created event.
               Returns an error structure if the account_identifier is invalid.
     """
-    logger.info(f"Tool 'create_caldav_event' called for account: {account_identifier}, calendar: {calendar_url} with ical_content (length: {len(ical_content)})")
-    service = caldav_services_map.get(account_identifier)
-    if not service:
-        logger.error(f"Account identifier '{account_identifier}' not found in configured services for 'create_caldav_event'.")
-        return {"status": "error", "message": f"Account identifier '{account_identifier}' not found."}
+    logger.info("Tool 'create_caldav_event' called for account: %s, calendar: %s with ical_content (length: %s)", account_identifier, calendar_url, len(ical_content))
+    ical_error = _ical_error(ical_content, "VEVENT")
+    if ical_error is not None:
+        logger.error("Invalid iCalendar content for account %s in 'create_caldav_event': %s", account_identifier, ical_error)
+        return {"status": "error", "message": f"Invalid iCalendar content: {ical_error}"}
 
-    try:
-        Calendar.from_ical(ical_content) # Validate iCalendar content
-    except ValueError as e:
-        logger.error(f"Invalid iCalendar content for account {account_identifier} in 'create_caldav_event': {str(e)}")
-        return {"status": "error", "message": f"Invalid iCalendar content: {str(e)}"}
+    result = await service.create_event(calendar_url, ical_content)
+    logger.info("Successfully created event for account %s: %s in calendar: %s", account_identifier, result.get('event_url'), calendar_url)
+    return result
+
+@mcp.tool()
+@_tool_errors(list)
+async def create_caldav_events(account_identifier: str, service: CalDAVService, calendar_url: str, ical_contents: list[str]) -> list:
+    """
+    Creates several events in the specified CalDAV calendar of a specific account in one call.
+
+    The events are created concurrently, so this is much faster than calling
+    `create_caldav_event` once per event. Invalid iCalendar strings are reported
+    without being sent to the server.
+
+    Args:
+        account_identifier (str): The URL of the CalDAV account (serves as its identifier).
+        calendar_url (str): The absolute URL of the calendar where the events will be created.
+        ical_contents (list[str]): The full iCalendar (VCS) strings of the events.
+
+    Returns:
+        list: One dictionary per iCalendar string, in the given order, with the 'status'
+              ('success' or 'error') and either the 'event_url' of the new event or a 'message'.
+              Returns an error structure if the account_identifier is invalid.
+    """
+    logger.info("Tool 'create_caldav_events' called for account: %s, calendar: %s, events: %s", account_identifier, calendar_url, len(ical_contents))
+    results = [None] * len(ical_contents)
+    valid = []
+    for index, ical_content in enumerate(ical_contents):
+        ical_error = _ical_error(ical_content, "VEVENT")
+        if ical_error is None:
+            valid.append(index)
+        else:
+            logger.error("Invalid iCalendar content for account %s in 'create_caldav_events': %s", account_identifier, ical_error)
+            results[index] = {"status": "error", "message": f"Invalid iCalendar content: {ical_error}"}
+    if valid:
+        created = await service.create_events(calendar_url, [ical_contents[index] for index in valid])
+        for index, result in zip(valid, created):
+            results[index] = result
+    logger.info("Processed creation of %s events for account %s", len(ical_contents), account_identifier)
+    return results
 
-    try:
-        result = await service.create_event(calendar_url, ical_content)
-        logger.info(f"Successfully created event for account {account_identifier}: {result.get('event_url')} in calendar: {calendar_url}")
-        return result
-    except CalDAVConnectionError as e:
-        logger.error(f"CalDAV connection error for account {account_identifier} in 'create_caldav_event': {str(e)}")
-        return {"status": "error", "message": f"CalDAV connection error for account {account_identifier}: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"An unexpected error occurred for account {account_identifier} in 'create_caldav_event'")
-        return {"status": "error", "message": f"An unexpected error occurred for account {account_identifier}: {str(e)}"}
 
 @mcp.tool()
-async def update_caldav_event(account_identifier: str, event_url: str, ical_content: str) -> dict:
+@_tool_errors(dict)
+async def update_caldav_event(account_identifier: str, service: CalDAVService, event_url: str, ical_content: str) -> dict:
     """
     Updates an existing CalDAV event in a specific account with new iCalendar content.
 
@@ -205,31 +459,19 @@ async def update_caldav_event(account_identifier: str, event_url: str, ical_cont
               and the 'event_url' of the updated event.
               Returns an error structure if the account_identifier is invalid.
     """
-    logger.info(f"Tool 'update_caldav_event' called for account: {account_identifier}, event: {event_url} with ical_content (length: {len(ical_content)})")
-    service = caldav_services_map.get(account_identifier)
-    if not service:
-        logger.error(f"Account identifier '{account_identifier}' not found in configured services for 'update_caldav_event'.")
-        return {"status": "error", "message": f"Account identifier '{account_identifier}' not found."}
-
-    try:
-        Calendar.from_ical(ical_content) # Validate iCalendar content
-    except ValueError as e:
-        logger.error(f"Invalid iCalendar content for account {account_identifier} in 'update_caldav_event' for event {event_url}: {str(e)}")
-        return {"status": "error", "message": f"Invalid iCalendar content: {str(e)}"}
+    logger.info("Tool 'update_caldav_event' called for account: %s, event: %s with ical_content (length: %s)", account_identifier, event_url, len(ical_content))
+    ical_error = _ical_error(ical_content, "VEVENT")
+    if ical_error is not None:
+        logger.error("Invalid iCalendar content for account %s in 'update_caldav_event' for event %s: %s", account_identifier, event_url, ical_error)
+        return {"status": "error", "message": f"Invalid iCalendar content: {ical_error}"}
 
-    try:
-        result = await service.update_event(event_url, ical_content)
-        logger.info(f"Successfully updated event for account {account_identifier}: {result.get('event_url')}")
-        return result
-    except CalDAVConnectionError as e:
-        logger.error(f"CalDAV connection error for account {account_identifier} in 'update_caldav_event' for event {event_url}: {str(e)}")
-        return {"status": "error", "message": f"CalDAV connection error for account {account_identifier}: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"An unexpected error occurred for account {account_identifier} in 'update_caldav_event' for event {event_url}")
-        return {"status": "error", "message": f"An unexpected error occurred for account {account_identifier}: {str(e)}"}
+    result = await service.update_event(event_url, ical_content)
+    logger.info("Successfully updated event for account %s: %s", account_identifier, result.get('event_url'))
+    return result
 
 @mcp.tool()
-async def delete_caldav_event(account_identifier: str, event_url: str) -> dict:
+@_tool_errors(dict)
+async def delete_caldav_event(account_identifier: str, service: CalDAVService, event_url: str) -> dict:
     """
     Deletes an event from a specific CalDAV account's server.
 
@@ -242,27 +484,39 @@ async def delete_caldav_event(account_identifier: str, event_url: str) -> dict:
               and the 'event_url' that was deleted.
               Returns an error structure if the account_identifier is invalid.
     """
-    logger.info(f"Tool 'delete_caldav_event' called for account: {account_identifier}, event: {event_url}")
-    service = caldav_services_map.get(account_identifier)
-    if not service:
-        logger.error(f"Account identifier '{account_identifier}' not found in configured services for 'delete_caldav_event'.")
-        return {"status": "error", "message": f"Account identifier '{account_identifier}' not found."}
+    logger.info("Tool 'delete_caldav_event' called for account: %s, event: %s", account_identifier, event_url)
+    result = await service.delete_event(event_url)
+    logger.info("Successfully deleted event for account %s: %s", account_identifier, event_url)
+    return result
 
-    try:
-        result = await service.delete_event(event_url)
-        logger.info(f"Successfully deleted event for account {account_identifier}: {event_url}")
-        return result
-    except CalDAVConnectionError as e:
-        logger.error(f"CalDAV connection error for account {account_identifier} in 'delete_caldav_event' for event {event_url}: {str(e)}")
-        return {"status": "error", "message": f"CalDAV connection error for account {account_identifier}: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"An unexpected error occurred for account {account_identifier} in 'delete_caldav_event' for event {event_url}")
-        return {"status": "error", "message": f"An unexpected error occurred for account {account_identifier}: {str(e)}"}
+@mcp.tool()
+@_tool_errors(list)
+async def delete_caldav_events(account_identifier: str, service: CalDAVService, event_urls: list[str]) -> list:
+    """
+    Deletes several events from a specific CalDAV account's server in one call.
+
+    The deletions run concurrently, so this is much faster than calling
+    `delete_caldav_event` once per event.
+
+    Args:
+        account_identifier (str): The URL of the CalDAV account (serves as its identifier).
+        event_urls (list[str]): The absolute URLs of the events to be deleted.
+
+    Returns:
+        list: One dictionary per event URL with the 'status' of its deletion
+              ('success' or 'error') and the 'event_url'; failed entries also carry a 'message'.
+              Returns an error structure if the account_identifier is invalid.
+    """
+    logger.info("Tool 'delete_caldav_events' called for account: %s, events: %s", account_identifier, len(event_urls))
+    result = await service.delete_events(event_urls)
+    logger.info("Processed deletion of %s events for account %s", len(event_urls), account_identifier)
+    return result
 
 # --- New Task (VTODO) Specific MCP Tools ---
 
 @mcp.tool()
-async def list_caldav_tasks(account_identifier: str, calendar_url: str, include_completed: bool = False) -> list:
+@_tool_errors(list)
+async def list_caldav_tasks(account_identifier: str, service: CalDAVService, calendar_url: str, include_completed: bool = False, only_props: list[str] = None) -> list:
     """
     Lists tasks (VTODOs) from a specified CalDAV calendar of a specific account.
 
@@ -270,31 +524,50 @@ async def list_caldav_tasks(account_identifier: str, calendar_url: str, include_
         account_identifier (str): The URL of the CalDAV account (serves as its identifier).
         calendar_url (str): The absolute URL of the calendar to query tasks from.
         include_completed (bool, optional): If True, completed tasks will be included. Defaults to False.
+        only_props (list[str], optional): iCalendar property names (e.g. ["SUMMARY"]) to return
+                                          instead of whole tasks. UID, STATUS, COMPLETED, DUE and
+                                          PRIORITY are always included.
 
     Returns:
         list: A list of dictionaries, each representing a task with 'url' and 'data'.
               Returns an error structure if the account_identifier is invalid.
     """
-    logger.info(f"Tool 'list_caldav_tasks' called for account: {account_identifier}, calendar: {calendar_url}, include_completed: {include_completed}")
-    service = caldav_services_map.get(account_identifier)
-    if not service:
-        logger.error(f"Account identifier '{account_identifier}' not found for 'list_caldav_tasks'.")
-        return [{"status": "error", "message": f"Account identifier '{account_identifier}' not found."}]
+    logger.info("Tool 'list_caldav_tasks' called for account: %s, calendar: %s, include_completed: %s", account_identifier, calendar_url, include_completed)
+    result = await service.get_tasks(calendar_url, include_completed, only_props=only_props)
+    logger.info("Successfully listed tasks for account %s, calendar: %s.", account_identifier, calendar_url)
+    return result
 
-    try:
-        result = await service.get_tasks(calendar_url, include_completed)
-        logger.info(f"Successfully listed tasks for account {account_identifier}, calendar: {calendar_url}.")
-        return result
-    except CalDAVConnectionError as e:
-        logger.error(f"CalDAV connection error for account {account_identifier} in 'list_caldav_tasks' for calendar {calendar_url}: {str(e)}")
-        return [{"status": "error", "message": f"CalDAV connection error for account {account_identifier}: {str(e)}"}]
-    except Exception as e:
-        logger.exception(f"An unexpected error for account {account_identifier} in 'list_caldav_tasks' for calendar {calendar_url}")
-        return [{"status": "error", "message": f"An unexpected error for account {account_identifier}: {str(e)}"}]
+
+@mcp.tool()
+@_tool_errors(list)
+async def list_caldav_tasks_multi(account_identifier: str, service: CalDAVService, calendar_urls: list[str], include_completed: bool = False, only_props: list[str] = None) -> list:
+    """
+    Lists tasks (VTODOs) from several calendars of a specific account in one call.
+
+    The calendars are queried concurrently, so this is much faster than calling
+    `list_caldav_tasks` once per calendar.
+
+    Args:
+        account_identifier (str): The URL of the CalDAV account (serves as its identifier).
+        calendar_urls (list[str]): The absolute URLs of the calendars to query tasks from.
+        include_completed (bool, optional): As for `list_caldav_tasks`.
+        only_props (list[str], optional): As for `list_caldav_tasks`.
+
+    Returns:
+        list: One dictionary per calendar URL with the 'status' of its listing
+              ('success' or 'error'), the 'calendar_url' and its 'tasks';
+              failed entries carry a 'message' instead of 'tasks'.
+              Returns an error structure if the account_identifier is invalid.
+    """
+    logger.info("Tool 'list_caldav_tasks_multi' called for account: %s, calendars: %s, include_completed: %s", account_identifier, len(calendar_urls), include_completed)
+    result = await service.get_tasks_multi(calendar_urls, include_completed, only_props=only_props)
+    logger.info("Listed tasks of %s calendars for account %s.", len(calendar_urls), account_identifier)
+    return result
 
 
 @mcp.tool()
-async def create_caldav_task(account_identifier: str, calendar_url: str, ical_content: str) -> dict:
+@_tool_errors(dict)
+async def create_caldav_task(account_identifier: str, service: CalDAVService, calendar_url: str, ical_content: str) -> dict:
     """
     Creates a new task (VTODO) in a specified CalDAV calendar of a specific account.
 
@@ -307,31 +580,19 @@ async def create_caldav_task(account_identifier: str, calendar_url: str, ical_co
         dict: Status of operation and 'task_url' of the new task.
               Returns an error structure if the account_identifier is invalid.
     """
-    logger.info(f"Tool 'create_caldav_task' called for account: {account_identifier}, calendar: {calendar_url} with ical_content (length: {len(ical_content)})")
-    service = caldav_services_map.get(account_identifier)
-    if not service:
-        logger.error(f"Account identifier '{account_identifier}' not found for 'create_caldav_task'.")
-        return {"status": "error", "message": f"Account identifier '{account_identifier}' not found."}
+    logger.info("Tool 'create_caldav_task' called for account: %s, calendar: %s with ical_content (length: %s)", account_identifier, calendar_url, len(ical_content))
+    ical_error = _ical_error(ical_content, "VTODO")
+    if ical_error is not None:
+        logger.error("Invalid iCalendar content for account %s in 'create_caldav_task': %s", account_identifier, ical_error)
+        return {"status": "error", "message": f"Invalid iCalendar content: {ical_error}"}
 
-    try:
-        Calendar.from_ical(ical_content) # Validate iCalendar content
-    except ValueError as e:
-        logger.error(f"Invalid iCalendar content for account {account_identifier} in 'create_caldav_task': {str(e)}")
-        return {"status": "error", "message": f"Invalid iCalendar content: {str(e)}"}
-
-    try:
-        result = await service.create_task(calendar_url, ical_content)
-        logger.info(f"Successfully created task for account {account_identifier}: {result.get('task_url')} in calendar: {calendar_url}")
-        return result
-    except CalDAVConnectionError as e:
-        logger.error(f"CalDAV connection error for account {account_identifier} in 'create_caldav_task': {str(e)}")
-        return {"status": "error", "message": f"CalDAV connection error for account {account_identifier}: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"An unexpected error for account {account_identifier} in 'create_caldav_task'")
-        return {"status": "error", "message": f"An unexpected error for account {account_identifier}: {str(e)}"}
+    result = await service.create_task(calendar_url, ical_content)
+    logger.info("Successfully created task for account %s: %s in calendar: %s", account_identifier, result.get('task_url'), calendar_url)
+    return result
 
 @mcp.tool()
-async def update_caldav_task(account_identifier: str, task_url: str, ical_content: str) -> dict:
+@_tool_errors(dict)
+async def update_caldav_task(account_identifier: str, service: CalDAVService, task_url: str, ical_content: str) -> dict:
     """
     Updates an existing CalDAV task (VTODO) in a specific account.
 
@@ -344,31 +605,19 @@ async def update_caldav_task(account_identifier: str, task_url: str, ical_conten
         dict: Status of operation and 'task_url' of the updated task.
               Returns an error structure if the account_identifier is invalid.
     """
-    logger.info(f"Tool 'update_caldav_task' called for account: {account_identifier}, task: {task_url} with ical_content (length: {len(ical_content)})")
-    service = caldav_services_map.get(account_identifier)
-    if not service:
-        logger.error(f"Account identifier '{account_identifier}' not found for 'update_caldav_task'.")
-        return {"status": "error", "message": f"Account identifier '{account_identifier}' not found."}
-
-    try:
-        Calendar.from_ical(ical_content) # Validate iCalendar content
-    except ValueError as e:
-        logger.error(f"Invalid iCalendar content for account {account_identifier} in 'update_caldav_task' for task {task_url}: {str(e)}")
-        return {"status": "error", "message": f"Invalid iCalendar content: {str(e)}"}
+    logger.info("Tool 'update_caldav_task' called for account: %s, task: %s with ical_content (length: %s)", account_identifier, task_url, len(ical_content))
+    ical_error = _ical_error(ical_content, "VTODO")
+    if ical_error is not None:
+        logger.error("Invalid iCalendar content for account %s in 'update_caldav_task' for task %s: %s", account_identifier, task_url, ical_error)
+        return {"status": "error", "message": f"Invalid iCalendar content: {ical_error}"}
 
-    try:
-        result = await service.update_task(task_url, ical_content)
-        logger.info(f"Successfully updated task for account {account_identifier}: {result.get('task_url')}")
-        return result
-    except CalDAVConnectionError as e:
-        logger.error(f"CalDAV connection error for account {account_identifier} in 'update_caldav_task' for task {task_url}: {str(e)}")
-        return {"status": "error", "message": f"CalDAV connection error for account {account_identifier}: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"An unexpected error for account {account_identifier} in 'update_caldav_task' for task {task_url}")
-        return {"status": "error", "message": f"An unexpected error for account {account_identifier}: {str(e)}"}
+    result = await service.update_task(task_url, ical_content)
+    logger.info("Successfully updated task for account %s: %s", account_identifier, result.get('task_url'))
+    return result
 
 @mcp.tool()
-async def delete_caldav_task(account_identifier: str, task_url: str) -> dict:
+@_tool_errors(dict)
+async def delete_caldav_task(account_identifier: str, service: CalDAVService, task_url: str) -> dict:
     """
     Deletes a task (VTODO) from a specific CalDAV account's server.
 
@@ -380,22 +629,31 @@ async def delete_caldav_task(account_identifier: str, task_url: str) -> dict:
         dict: Status of operation and 'task_url' that was deleted.
               Returns an error structure if the account_identifier is invalid.
     """
-    logger.info(f"Tool 'delete_caldav_task' called for account: {account_identifier}, task: {task_url}")
-    service = caldav_services_map.get(account_identifier)
-    if not service:
-        logger.error(f"Account identifier '{account_identifier}' not found for 'delete_caldav_task'.")
-        return {"status": "error", "message": f"Account identifier '{account_identifier}' not found."}
+    logger.info("Tool 'delete_caldav_task' called for account: %s, task: %s", account_identifier, task_url)
+    result = await service.delete_task(task_url)
+    logger.info("Successfully deleted task for account %s: %s", account_identifier, task_url)
+    return result
 
-    try:
-        result = await service.delete_task(task_url)
-        logger.info(f"Successfully deleted task for account {account_identifier}: {task_url}")
-        return result
-    except CalDAVConnectionError as e:
-        logger.error(f"CalDAV connection error for account {account_identifier} in 'delete_caldav_task' for task {task_url}: {str(e)}")
-        return {"status": "error", "message": f"CalDAV connection error for account {account_identifier}: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"An unexpected error for account {account_identifier} in 'delete_caldav_task' for task {task_url}")
-        return {"status": "error", "message": f"An unexpected error for account {account_identifier}: {str(e)}"}
+
+@mcp.tool()
+@_tool_errors(list)
+async def delete_caldav_tasks(account_identifier: str, service: CalDAVService, task_urls: list[str]) -> list:
+    """
+    Deletes several tasks (VTODOs) from a specific CalDAV account's server in one call.
+
+    Args:
+        account_identifier (str): The URL of the CalDAV account (serves as its identifier).
+        task_urls (list[str]): The URLs of the tasks to be deleted.
+
+    Returns:
+        list: One dictionary per task URL with the 'status' of its deletion
+              ('success' or 'error') and the 'task_url'; failed entries also carry a 'message'.
+              Returns an error structure if the account_identifier is invalid.
+    """
+    logger.info("Tool 'delete_caldav_tasks' called for account: %s, tasks: %s", account_identifier, len(task_urls))
+    result = await service.delete_tasks(task_urls)
+    logger.info("Processed deletion of %s tasks for account %s", len(task_urls), account_identifier)
+    return result
 
 
 # This block ensures the MCP server starts when the script is executed directly.
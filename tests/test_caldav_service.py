@@ -1,17 +1,16 @@
 # tests/test_caldav_service.py
+import asyncio
+import threading
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime, timedelta
-import pytz
+from unittest.mock import AsyncMock, MagicMock, call, patch
+from datetime import datetime, timedelta, timezone
 from icalendar import Calendar as ICalCalendar, Event as ICalEvent, Todo as ICalTodo # For creating test ical data
 
-# Make sure caldav_service is importable, adjust sys.path if necessary
-# This might require adding the root project directory to sys.path
-# For example, by having a conftest.py in tests/ with:
-# import sys, os; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-# For now, assume it's handled by the execution environment or PYTHONPATH.
-
-from caldav_service import CalDAVService, CalDAVConnectionError
+# tests/conftest.py puts the project root on sys.path
+from caldav_service import (
+    CalDAVService, CalDAVConnectionError, LazyICal, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
+    EVENT_SEARCH_OPTIONS, TASK_SORT_KEYS
+)
 import caldav.lib.error # To mock caldav.lib.error.AuthorizationError
 import requests.exceptions # To mock requests.exceptions.ConnectionError
 
@@ -56,6 +55,10 @@ END:VTODO
 END:VCALENDAR
 """
 
+# Bodies for update tests, which must differ from what the service last saw
+SAMPLE_EVENT_ICAL_UPDATED = SAMPLE_EVENT_ICAL.replace("Test Event", "Updated Test Event")
+SAMPLE_TASK_ICAL_UPDATED = SAMPLE_TASK_ICAL_INCOMPLETE.replace("Incomplete Task", "Updated Incomplete Task")
+
 
 @pytest.fixture
 def mock_dav_client_instance():
@@ -73,23 +76,29 @@ def mock_principal():
     principal_mock.calendars = MagicMock(return_value=[]) # Default empty list
     return principal_mock
 
+def _release(service):
+    """Frees the service's worker threads and HTTP session once a test is done with it."""
+    service._pool.shutdown(wait=False)
+    service._session.close()
+
 @pytest.fixture
 def service(mock_dav_client_instance, mock_principal):
-    # Patch caldav.DAVClient to return our mock_dav_client_instance
-    with patch('caldav.DAVClient', return_value=mock_dav_client_instance):
-        service = CalDAVService(url="http://dummy.url", username="user", password="pass")
-        # Pre-assign the mocked principal to avoid connect() actually trying to fetch it via network
-        service.principal = mock_principal
-        service.client = mock_dav_client_instance # Assign the client as well
-        return service
+    # The constructor does no I/O and builds no DAVClient, so nothing needs patching here
+    service = CalDAVService(url="http://dummy.url", username="user", password="pass")
+    # Pre-assign the mocked principal to avoid connect() actually trying to fetch it via network
+    service.principal = mock_principal
+    service.client = mock_dav_client_instance # Assign the client as well
+    service._connected.set() # Mark the service as connected so methods skip connect()
+    yield service
+    _release(service)
 
 @pytest.fixture # Separate fixture for testing connect() itself
 def service_for_connect_test():
     service = CalDAVService(url="http://dummy.url", username="user", password="pass")
-    return service
+    yield service
+    _release(service)
 
 
-@pytest.mark.asyncio
 async def test_connect_success(service_for_connect_test, mock_principal):
     with patch('caldav.DAVClient') as mock_dav_client_constructor:
         mock_client_instance = mock_dav_client_constructor.return_value
@@ -105,13 +114,67 @@ async def test_connect_success(service_for_connect_test, mock_principal):
         mock_client_instance.principal.assert_called_once()
 
 
-@pytest.mark.asyncio
+async def test_davclient_is_reused_across_operations(service_for_connect_test, mock_principal):
+    with patch('caldav.DAVClient') as mock_dav_client_constructor:
+        mock_client_instance = mock_dav_client_constructor.return_value
+        mock_client_instance.principal = MagicMock(return_value=mock_principal)
+        mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+        mock_calendar_obj.save_event = MagicMock(return_value=MagicMock(url="http://dummy.url/cal1/e.ics"))
+        mock_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+        mock_client_instance.request = MagicMock(return_value=MagicMock(status=204))
+
+        await service_for_connect_test.get_calendars()
+        await service_for_connect_test.create_event("http://dummy.url/cal1", SAMPLE_EVENT_ICAL)
+        await service_for_connect_test.delete_event("http://dummy.url/cal1/e.ics")
+
+    # One client, and with it one pooled keep-alive session, serves every operation
+    mock_dav_client_constructor.assert_called_once()
+    assert mock_client_instance.session is service_for_connect_test._session
+
+async def test_connect_uses_pooled_session(service_for_connect_test, mock_principal):
+    with patch('caldav.DAVClient') as mock_dav_client_constructor:
+        mock_client_instance = mock_dav_client_constructor.return_value
+        mock_client_instance.principal = MagicMock(return_value=mock_principal)
+
+        await service_for_connect_test.connect()
+
+    session = service_for_connect_test._session
+    assert mock_client_instance.session is session
+    adapter = session.get_adapter("https://dummy.url")
+    assert adapter._pool_connections == HTTP_POOL_CONNECTIONS
+    assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+    assert adapter.max_retries.total == 3
+    assert "REPORT" in adapter.max_retries.allowed_methods
+
+    with patch.object(session, 'close') as mock_close:
+        await service_for_connect_test.aclose()
+    mock_close.assert_called_once()
+
+
+async def test_blocking_calls_run_in_service_pool(service, mock_principal):
+    thread_names = []
+    def _calendars():
+        thread_names.append(threading.current_thread().name)
+        return []
+    mock_principal.calendars = MagicMock(side_effect=_calendars)
+
+    await service.get_calendars()
+    assert thread_names[0].startswith("caldav")
+
+    await service.aclose()
+    assert service._pool._shutdown
+
+def test_thread_pool_bounded_by_http_pool():
+    service = CalDAVService(url="http://dummy.url", username="user", password="pass", max_workers=10_000)
+    assert service._pool._max_workers == HTTP_POOL_MAXSIZE
+    service._pool.shutdown(wait=False)
+
+
 async def test_connect_connection_error(service_for_connect_test):
     with patch('caldav.DAVClient', side_effect=requests.exceptions.ConnectionError("Test connection error")):
         with pytest.raises(CalDAVConnectionError, match="Connection to CalDAV server failed"):
             await service_for_connect_test.connect()
 
-@pytest.mark.asyncio
 async def test_connect_auth_error(service_for_connect_test):
     # Mock the DAVClient constructor
     with patch('caldav.DAVClient') as mock_dav_client_constructor:
@@ -124,14 +187,13 @@ async def test_connect_auth_error(service_for_connect_test):
             await service_for_connect_test.connect()
 
 
-@pytest.mark.asyncio
 async def test_get_calendars_success(service, mock_principal):
     mock_cal1 = MagicMock(spec=caldav.objects.Calendar) # Use spec
-    mock_cal1.get_property = MagicMock(return_value="Personal")
+    mock_cal1.name = "Personal" # Filled in by the calendars() PROPFIND
     mock_cal1.url = "http://dummy.url/cal1"
 
     mock_cal2 = MagicMock(spec=caldav.objects.Calendar) # Use spec
-    mock_cal2.get_property = MagicMock(return_value="Work")
+    mock_cal2.name = "Work"
     mock_cal2.url = "http://dummy.url/cal2"
 
     # .calendars() is a synchronous method, its mock should be MagicMock
@@ -142,8 +204,100 @@ async def test_get_calendars_success(service, mock_principal):
     assert {"name": "Personal", "url": "http://dummy.url/cal1"} in calendars
     assert {"name": "Work", "url": "http://dummy.url/cal2"} in calendars
     mock_principal.calendars.assert_called_once()
+    # Display names come from the listing itself, no per-calendar round trip
+    mock_cal1.get_property.assert_not_called()
+    mock_cal2.get_property.assert_not_called()
+
+async def test_get_calendars_fetches_missing_display_name(service, mock_principal):
+    mock_cal = MagicMock(spec=caldav.objects.Calendar)
+    mock_cal.name = None # Server omitted displayname from the listing
+    mock_cal.get_property = MagicMock(return_value="Fallback")
+    mock_cal.url = "http://dummy.url/cal1"
+    mock_principal.calendars = MagicMock(return_value=[mock_cal])
+
+    calendars = await service.get_calendars()
+    assert calendars == [{"name": "Fallback", "url": "http://dummy.url/cal1"}]
+    mock_cal.get_property.assert_called_once()
+
+async def test_get_calendars_cached_within_ttl(service, mock_principal):
+    mock_cal = MagicMock(spec=caldav.objects.Calendar)
+    mock_cal.name = "Personal"
+    mock_cal.url = "http://dummy.url/cal1"
+    mock_principal.calendars = MagicMock(return_value=[mock_cal])
+
+    first = await service.get_calendars()
+    first[0]["name"] = "Mutated by caller"
+    second = await service.get_calendars()
+    assert second == [{"name": "Personal", "url": "http://dummy.url/cal1"}]
+    mock_principal.calendars.assert_called_once()
+
+    # Once the TTL has passed the list is fetched again
+    service._calendars_ttl = service._calendars_stale_ttl = 0
+    await service.get_calendars()
+    assert mock_principal.calendars.call_count == 2
+
+async def test_get_calendars_rejected_credentials_force_reconnect(service, mock_principal):
+    mock_cal = MagicMock(spec=caldav.objects.Calendar)
+    mock_cal.name = "Personal"
+    mock_cal.url = "http://dummy.url/cal1"
+    mock_principal.calendars = MagicMock(return_value=[mock_cal])
+    await service.get_calendars()
+
+    service._calendars_ttl = service._calendars_stale_ttl = 0
+    mock_principal.calendars.side_effect = caldav.lib.error.AuthorizationError("Rotated")
+    with pytest.raises(caldav.lib.error.AuthorizationError):
+        await service.get_calendars()
+    # The principal and cached list are dropped so the next call rediscovers them
+    assert not service._connected.is_set()
+    assert service._calendars_cache is None
+
+async def test_get_calendars_serves_stale_while_refreshing(service, mock_principal):
+    mock_cal = MagicMock(spec=caldav.objects.Calendar)
+    mock_cal.name = "Personal"
+    mock_cal.url = "http://dummy.url/cal1"
+    mock_principal.calendars = MagicMock(return_value=[mock_cal])
+    await service.get_calendars()
+
+    mock_cal.name = "Renamed"
+    service._calendars_ttl = 0 # Expired, but still within the stale window
+    stale = await service.get_calendars()
+    assert stale == [{"name": "Personal", "url": "http://dummy.url/cal1"}]
+
+    await asyncio.gather(*service._refreshes.values())
+    assert mock_principal.calendars.call_count == 2
+    service._calendars_ttl = 60
+    assert await service.get_calendars() == [{"name": "Renamed", "url": "http://dummy.url/cal1"}]
+
+async def test_concurrent_calls_connect_once(service_for_connect_test, mock_principal):
+    with patch('caldav.DAVClient') as mock_dav_client_constructor:
+        mock_client_instance = mock_dav_client_constructor.return_value
+        mock_client_instance.principal = MagicMock(return_value=mock_principal)
+        mock_principal.calendars = MagicMock(return_value=[])
+
+        await asyncio.gather(
+            service_for_connect_test._ensure_connected(),
+            service_for_connect_test._ensure_connected(),
+            service_for_connect_test.connect(),
+        )
+        mock_client_instance.principal.assert_called_once()
+        mock_dav_client_constructor.assert_called_once()
+        assert service_for_connect_test._connected.is_set()
+
+async def test_failed_connect_is_retried(service_for_connect_test, mock_principal):
+    with patch('caldav.DAVClient') as mock_dav_client_constructor:
+        mock_client_instance = mock_dav_client_constructor.return_value
+        mock_client_instance.principal = MagicMock(
+            side_effect=[requests.exceptions.ConnectionError("down"), mock_principal]
+        )
+
+        with pytest.raises(CalDAVConnectionError):
+            await service_for_connect_test.connect()
+        assert service_for_connect_test.client is None
+        assert not service_for_connect_test._connected.is_set()
+
+        await service_for_connect_test._ensure_connected()
+        assert service_for_connect_test.principal == mock_principal
 
-@pytest.mark.asyncio
 async def test_get_calendars_connect_implicit_call(service_for_connect_test, mock_principal):
     # Test that connect() is called if principal is not set
     service_for_connect_test.principal = None # Ensure principal is not set initially
@@ -159,7 +313,6 @@ async def test_get_calendars_connect_implicit_call(service_for_connect_test, moc
         mock_principal.calendars.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_events_success(service, mock_dav_client_instance):
     calendar_url = "http://dummy.url/cal1"
     # .calendar() is sync, returns a Calendar object mock
@@ -170,11 +323,11 @@ async def test_get_events_success(service, mock_dav_client_instance):
     mock_event1 = MagicMock(spec=caldav.objects.Event)
     mock_event1.url = "http://dummy.url/cal1/event1.ics"
     mock_event1.data = SAMPLE_EVENT_ICAL
-    # .date_search() is sync
-    mock_calendar_obj.date_search = MagicMock(return_value=[mock_event1])
+    # .search() is sync
+    mock_calendar_obj.search = MagicMock(return_value=[mock_event1])
 
-    start_date = datetime(2023, 1, 1, tzinfo=pytz.utc)
-    end_date = datetime(2023, 1, 31, tzinfo=pytz.utc)
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    end_date = datetime(2023, 1, 31, tzinfo=timezone.utc)
 
     events = await service.get_events(calendar_url, start_date, end_date)
 
@@ -182,35 +335,250 @@ async def test_get_events_success(service, mock_dav_client_instance):
     assert events[0]["url"] == "http://dummy.url/cal1/event1.ics"
     assert events[0]["data"] == SAMPLE_EVENT_ICAL
     mock_dav_client_instance.calendar.assert_called_once_with(url=calendar_url)
-    # Corrected: date_search arguments are start and end, not a dict
-    mock_calendar_obj.date_search.assert_called_once_with(start=start_date, end=end_date)
+    # Corrected: search arguments are start and end, not a dict
+    mock_calendar_obj.search.assert_called_once_with(start=start_date, end=end_date, **EVENT_SEARCH_OPTIONS)
 
-@pytest.mark.asyncio
 async def test_get_events_default_dates(service, mock_dav_client_instance):
     calendar_url = "http://dummy.url/cal1"
     mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
     mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
-    mock_calendar_obj.date_search = MagicMock(return_value=[]) # No events needed for this test
+    mock_calendar_obj.search = MagicMock(return_value=[]) # No events needed for this test
 
     await service.get_events(calendar_url) # Call with default dates
 
-    mock_calendar_obj.date_search.assert_called_once()
+    mock_calendar_obj.search.assert_called_once()
     # Corrected: Access positional or keyword arguments based on how they are passed.
-    # Assuming they are passed as keyword arguments `start` and `end` to date_search.
-    # If date_search is called like date_search(start=X, end=Y), then args[0] would be empty, and args[1] (kwargs) would have them.
-    # If date_search is called like date_search(X, Y), then args[0][0] is start, args[0][1] is end.
-    # The actual implementation CalDAVService.get_events calls it as calendar.date_search(start=start_date, end=end_date)
-    called_args_kwargs = mock_calendar_obj.date_search.call_args.kwargs
+    # Assuming they are passed as keyword arguments `start` and `end` to search.
+    # If search is called like search(start=X, end=Y), then args[0] would be empty, and args[1] (kwargs) would have them.
+    # If search is called like search(X, Y), then args[0][0] is start, args[0][1] is end.
+    # The actual implementation CalDAVService.get_events calls it as calendar.search(start=start_date, end=end_date, ...)
+    called_args_kwargs = mock_calendar_obj.search.call_args.kwargs
 
     assert isinstance(called_args_kwargs['start'], datetime)
     assert isinstance(called_args_kwargs['end'], datetime)
-    # Default start is 30 days ago, end is 1 year from now.
-    # Allow a small delta for the time 'now' is calculated.
-    assert (datetime.now(pytz.utc) - timedelta(days=30) - called_args_kwargs['start']).total_seconds() < 5
-    assert (datetime.now(pytz.utc) + timedelta(days=365) - called_args_kwargs['end']).total_seconds() < 5
+    # Default start is 30 days before today, end is 1 year after today, on whole UTC days.
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    assert called_args_kwargs['start'] == today - timedelta(days=30)
+    assert called_args_kwargs['end'] == today + timedelta(days=366)
+
+async def test_get_events_default_dates_reuse_cache(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_calendar_obj.url = calendar_url
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj.search = MagicMock(return_value=[])
+    mock_calendar_obj.get_property = MagicMock(return_value="ctag-1")
+
+    for _ in range(3):
+        await service.get_events(calendar_url)
+
+    # The default range is the same on every call, so the unchanged CTag serves it from memory
+    mock_calendar_obj.search.assert_called_once()
+    assert len(service._event_windows[(calendar_url, None)][1]) == 1
+
+async def test_get_events_reuses_cache_while_ctag_unchanged(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_calendar_obj.url = calendar_url
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+
+    mock_event1 = MagicMock(spec=caldav.objects.Event)
+    mock_event1.url = "http://dummy.url/cal1/event1.ics"
+    mock_event1.data = SAMPLE_EVENT_ICAL
+    mock_calendar_obj.search = MagicMock(return_value=[mock_event1])
+    mock_calendar_obj.get_property = MagicMock(return_value="ctag-1")
+
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    end_date = datetime(2023, 1, 31, tzinfo=timezone.utc)
+
+    first = await service.get_events(calendar_url, start_date, end_date)
+    second = await service.get_events(calendar_url, start_date, end_date)
+    assert first == second
+    mock_calendar_obj.search.assert_called_once()
+    mock_calendar_obj.get_property.assert_called_once() # The CTag is still fresh
+
+    # A new CTag means the collection changed, so the events are fetched again
+    mock_calendar_obj.get_property.return_value = "ctag-2"
+    service._ctag_fresh_ttl = service._ctag_stale_ttl = 0
+    await service.get_events(calendar_url, start_date, end_date)
+    assert mock_calendar_obj.search.call_count == 2
+
+async def test_own_write_forces_ctag_check(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_calendar_obj.url = calendar_url
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj.search = MagicMock(return_value=[])
+    mock_calendar_obj.get_property = MagicMock(return_value="ctag-1")
+    await service.get_events(calendar_url)
+
+    mock_calendar_obj.save_event = MagicMock(return_value=MagicMock(url=f"{calendar_url}/new.ics"))
+    await service.create_event(calendar_url, SAMPLE_EVENT_ICAL)
+    mock_calendar_obj.get_property.return_value = "ctag-2"
+    await service.get_events(calendar_url)
+
+    assert mock_calendar_obj.get_property.call_count == 2
+    assert mock_calendar_obj.search.call_count == 2
+
+async def test_ctag_check_overtaken_by_own_write_is_not_stored(service):
+    calendar_url = "http://dummy.url/cal1"
+    started, release = threading.Event(), threading.Event()
+    def _slow_ctag(prop):
+        started.set()
+        release.wait(5)
+        return "ctag-before-write"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar, url=calendar_url)
+    mock_calendar_obj.get_property = MagicMock(side_effect=_slow_ctag)
+
+    check = asyncio.ensure_future(service._check_ctag(calendar_url, mock_calendar_obj))
+    await asyncio.to_thread(started.wait, 5)
+    service._forget_ctag(f"{calendar_url}/new.ics") # Our write finishes while the PROPFIND is out
+    release.set()
+
+    assert await check is None
+    assert calendar_url not in service._ctags
+
+async def test_get_events_no_cache_without_ctag(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_calendar_obj.url = calendar_url
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj.search = MagicMock(return_value=[])
+    mock_calendar_obj.get_property = MagicMock(return_value=None) # Server exposes no CTag
+
+    await service.get_events(calendar_url)
+    await service.get_events(calendar_url)
+    assert mock_calendar_obj.search.call_count == 2
+
+async def test_get_events_fetches_only_uncovered_range(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_calendar_obj.url = calendar_url
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj.get_property = MagicMock(return_value="ctag-1")
+
+    early_event = MagicMock(spec=caldav.objects.Event)
+    early_event.url = "http://dummy.url/cal1/early.ics"
+    early_event.data = SAMPLE_EVENT_ICAL.replace("20230101T1", "20230105T1")
+    mid_event = MagicMock(spec=caldav.objects.Event)
+    mid_event.url = "http://dummy.url/cal1/mid.ics"
+    mid_event.data = SAMPLE_EVENT_ICAL.replace("20230101T1", "20230120T1")
+    late_event = MagicMock(spec=caldav.objects.Event)
+    late_event.url = "http://dummy.url/cal1/late.ics"
+    late_event.data = SAMPLE_EVENT_ICAL.replace("20230101T1", "20230210T1")
+
+    jan1 = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    jan15 = datetime(2023, 1, 15, tzinfo=timezone.utc)
+    feb1 = datetime(2023, 2, 1, tzinfo=timezone.utc)
+    feb15 = datetime(2023, 2, 15, tzinfo=timezone.utc)
+
+    mock_calendar_obj.search = MagicMock(return_value=[early_event, mid_event])
+    await service.get_events(calendar_url, jan1, feb1)
+
+    # Scrolling forward only queries the part not fetched yet
+    mock_calendar_obj.search = MagicMock(return_value=[late_event])
+    events = await service.get_events(calendar_url, jan15, feb15)
+    mock_calendar_obj.search.assert_called_once_with(start=feb1, end=feb15, **EVENT_SEARCH_OPTIONS)
+    assert [e["url"] for e in events] == ["http://dummy.url/cal1/mid.ics", "http://dummy.url/cal1/late.ics"]
+
+
+def _expanded_weekly(*days):
+    """Listing data for a weekly event expanded to the occurrences on the given dates (YYYYMMDD)."""
+    occurrences = "".join(
+        f"BEGIN:VEVENT\nUID:weekly\nSUMMARY:Weekly\nDTSTART:{day}T100000Z\nDTEND:{day}T110000Z\n"
+        f"RECURRENCE-ID:{day}T100000Z\nEND:VEVENT\n"
+        for day in days
+    )
+    return f"BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//Test//EN\n{occurrences}END:VCALENDAR\n"
+
+async def test_get_events_refetches_range_holding_expanded_events(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_calendar_obj.url = calendar_url
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj.get_property = MagicMock(return_value="ctag-1")
+
+    jan1 = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    feb1 = datetime(2023, 2, 1, tzinfo=timezone.utc)
+    apr1 = datetime(2023, 4, 1, tzinfo=timezone.utc)
+    january = MagicMock(spec=caldav.objects.Event, url="http://dummy.url/cal1/weekly.ics")
+    january.data = _expanded_weekly("20230102", "20230109")
+    mock_calendar_obj.search = MagicMock(return_value=[january])
+    await service.get_events(calendar_url, jan1, feb1)
+
+    # The cached January copy only holds January occurrences, so the whole range is queried
+    quarter = MagicMock(spec=caldav.objects.Event, url="http://dummy.url/cal1/weekly.ics")
+    quarter.data = _expanded_weekly("20230102", "20230109", "20230206", "20230306")
+    mock_calendar_obj.search = MagicMock(return_value=[quarter])
+    events = await service.get_events(calendar_url, jan1, apr1)
+    mock_calendar_obj.search.assert_called_once_with(start=jan1, end=apr1, **EVENT_SEARCH_OPTIONS)
+    assert len(events) == 1 and "DTSTART:20230206T100000Z" in events[0]["data"]
+
+    # An exact repeat of a cached range is still served from memory
+    await service.get_events(calendar_url, jan1, apr1)
+    mock_calendar_obj.search.assert_called_once()
+
+async def test_get_events_expanded_data_not_parse_cached(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj.get_property = MagicMock(return_value=None)
+
+    # The same object and ETag listed for two windows, expanded differently for each
+    def _listed(*days):
+        event = MagicMock(spec=caldav.objects.Event, url="http://dummy.url/cal1/weekly.ics")
+        event.data = _expanded_weekly(*days)
+        event.props = {"{DAV:}getetag": '"etag-1"'}
+        return [event]
+
+    mock_calendar_obj.search = MagicMock(return_value=_listed("20230102"))
+    january = await service.get_events(calendar_url, datetime(2023, 1, 1, tzinfo=timezone.utc), datetime(2023, 2, 1, tzinfo=timezone.utc))
+    january[0]["data"].parsed()
+    mock_calendar_obj.search = MagicMock(return_value=_listed("20230206"))
+    february = await service.get_events(calendar_url, datetime(2023, 2, 1, tzinfo=timezone.utc), datetime(2023, 3, 1, tzinfo=timezone.utc))
+
+    starts = [component["DTSTART"].dt.day for component in february[0]["data"].parsed().walk("VEVENT")]
+    assert starts == [6] # February's own occurrence, not the parse of January's data
+
+async def test_update_event_resubmitting_expanded_data_still_puts(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    event_url = "http://dummy.url/cal1/weekly.ics"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj.get_property = MagicMock(return_value=None)
+    listed = MagicMock(spec=caldav.objects.Event, url=event_url)
+    listed.data = _expanded_weekly("20230102", "20230109")
+    listed.props = {"{DAV:}getetag": '"etag-1"'}
+    mock_calendar_obj.search = MagicMock(return_value=[listed])
+    events = await service.get_events(calendar_url, datetime(2023, 1, 1, tzinfo=timezone.utc), datetime(2023, 2, 1, tzinfo=timezone.utc))
+    mock_dav_client_instance.put = MagicMock(return_value=MagicMock(status=204, headers={"ETag": '"etag-2"'}))
+
+    # The listed occurrences are not the stored recurring body, so saving them changes the event
+    result = await service.update_event(event_url, str(events[0]["data"]))
+    assert "cached" not in result
+    assert mock_dav_client_instance.put.call_args.args[2]["If-Match"] == '"etag-1"'
+
+
+async def test_get_events_only_props_requests_partial_data(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1/"
+    # A real Calendar builds the REPORT body; only the network calls are mocked
+    calendar_obj = caldav.DAVClient(url="http://dummy.url").calendar(url=calendar_url)
+    calendar_obj.get_property = MagicMock(return_value=None)
+    calendar_obj.search = MagicMock(return_value=[])
+    mock_dav_client_instance.calendar = MagicMock(return_value=calendar_obj)
+
+    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    end_date = datetime(2023, 1, 31, tzinfo=timezone.utc)
+    await service.get_events(calendar_url, start_date, end_date, only_props=["summary"])
+
+    query = str(calendar_obj.search.call_args.kwargs["xml"])
+    assert '<C:comp name="VEVENT">' in query
+    assert '<C:prop name="SUMMARY"/>' in query
+    assert '<C:prop name="DTSTART"/>' in query # Always included for range checks
+    assert '<C:prop name="DESCRIPTION"/>' not in query
+    assert '<C:time-range start="20230101T000000Z" end="20230131T000000Z"/>' in query
 
 
-@pytest.mark.asyncio
 async def test_create_event_success(service, mock_dav_client_instance):
     calendar_url = "http://dummy.url/cal1"
     mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
@@ -228,48 +596,115 @@ async def test_create_event_success(service, mock_dav_client_instance):
     assert result["event_url"] == "http://dummy.url/cal1/newevent.ics"
     mock_calendar_obj.save_event.assert_called_once_with(ical=SAMPLE_EVENT_ICAL)
 
+async def test_create_events_reports_each_outcome(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj.save_event = MagicMock(side_effect=[
+        MagicMock(url="http://dummy.url/cal1/a.ics"),
+        caldav.lib.error.PutError("Rejected"),
+    ])
+
+    results = await service.create_events(calendar_url, [SAMPLE_EVENT_ICAL, SAMPLE_EVENT_ICAL])
+
+    assert results[0] == {"status": "success", "event_url": "http://dummy.url/cal1/a.ics"}
+    assert results[1]["status"] == "error" and "Rejected" in results[1]["message"]
+    assert mock_calendar_obj.save_event.call_count == 2
+
+async def test_calendar_handle_reused_across_calls(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    mock_calendar_obj.save_event = MagicMock(return_value=MagicMock(url="http://dummy.url/cal1/e.ics"))
+    mock_calendar_obj.save_todo = MagicMock(return_value=MagicMock(url="http://dummy.url/cal1/t.ics"))
+    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+
+    await service.create_event(calendar_url, SAMPLE_EVENT_ICAL)
+    await service.create_task(calendar_url, SAMPLE_TASK_ICAL_INCOMPLETE)
+
+    mock_dav_client_instance.calendar.assert_called_once_with(url=calendar_url)
+
 
-@pytest.mark.asyncio
 async def test_update_event_success(service, mock_dav_client_instance):
     event_url = "http://dummy.url/cal1/event1.ics"
-    # .event() is sync, returns an Event object mock
-    mock_event_obj = MagicMock(spec=caldav.objects.Event)
-    mock_event_obj.url = event_url
-    # .save() is sync
-    mock_event_obj.save = MagicMock()
-    mock_dav_client_instance.event = MagicMock(return_value=mock_event_obj)
-
-    new_ical_content = SAMPLE_EVENT_ICAL.replace("Test Event", "Updated Test Event")
+    mock_dav_client_instance.put = MagicMock(return_value=MagicMock(status=204, headers={"ETag": '"etag-2"'}))
+
+    new_ical_content = SAMPLE_EVENT_ICAL_UPDATED
     result = await service.update_event(event_url, new_ical_content)
 
     assert result["status"] == "success"
     assert result["event_url"] == event_url
-    mock_dav_client_instance.event.assert_called_once_with(url=event_url)
-    assert mock_event_obj.data == new_ical_content # Check data was assigned
-    mock_event_obj.save.assert_called_once()
+    # Unknown ETag: a single PUT that only requires the event to exist, no prior fetch
+    mock_dav_client_instance.put.assert_called_once()
+    put_url, put_body, put_headers = mock_dav_client_instance.put.call_args.args
+    assert (put_url, put_body, put_headers["If-Match"]) == (event_url, new_ical_content.encode(), "*")
+    assert put_headers["Content-Type"] == 'text/calendar; charset="utf-8"'
+    mock_dav_client_instance.request.assert_not_called() # No GET of the event first
+    assert service._etags[event_url] == ("VEVENT", '"etag-2"')
+
+async def test_update_event_identical_content_skips_put(service, mock_dav_client_instance):
+    event_url = "http://dummy.url/cal1/event1.ics"
+    mock_dav_client_instance.put = MagicMock(return_value=MagicMock(status=204, headers={"ETag": '"etag-2"'}))
+
+    await service.update_event(event_url, SAMPLE_EVENT_ICAL)
+    result = await service.update_event(event_url, SAMPLE_EVENT_ICAL)
+    assert result == {"status": "success", "event_url": event_url, "cached": True}
+    mock_dav_client_instance.put.assert_called_once()
+
+    # Different content is still written, guarded by the ETag of our own PUT
+    await service.update_event(event_url, SAMPLE_EVENT_ICAL_UPDATED)
+    assert mock_dav_client_instance.put.call_count == 2
+    assert mock_dav_client_instance.put.call_args.args[2]["If-Match"] == '"etag-2"'
+
+async def test_update_event_not_found(service, mock_dav_client_instance):
+    event_url = "http://dummy.url/cal1/gone.ics"
+    mock_dav_client_instance.put = MagicMock(return_value=MagicMock(status=412, headers={}))
+
+    with pytest.raises(caldav.lib.error.NotFoundError, match="Event not found"):
+        await service.update_event(event_url, SAMPLE_EVENT_ICAL)
+
+async def test_update_event_changed_on_server_is_not_overwritten(service, mock_dav_client_instance):
+    event_url = "http://dummy.url/cal1/event1.ics"
+    service._etags[event_url] = ("VEVENT", '"etag-1"') # As recorded by an earlier listing
+    mock_dav_client_instance.put = MagicMock(return_value=MagicMock(status=412, headers={}))
+
+    with pytest.raises(caldav.lib.error.PutError, match="changed on the server"):
+        await service.update_event(event_url, SAMPLE_EVENT_ICAL_UPDATED)
+
+    # Only the conditional PUT was sent; no retry with `If-Match: *`
+    mock_dav_client_instance.put.assert_called_once()
+    assert mock_dav_client_instance.put.call_args.args[2]["If-Match"] == '"etag-1"'
 
 
-@pytest.mark.asyncio
 async def test_delete_event_success(service, mock_dav_client_instance):
     event_url = "http://dummy.url/cal1/event1.ics"
-    mock_event_obj = MagicMock(spec=caldav.objects.Event)
-    # .delete() is sync
-    mock_event_obj.delete = MagicMock()
-    mock_dav_client_instance.event = MagicMock(return_value=mock_event_obj)
+    service._etags[event_url] = ("VEVENT", '"etag-1"') # As recorded by an earlier listing
+    mock_dav_client_instance.request = MagicMock(return_value=MagicMock(status=204))
 
     result = await service.delete_event(event_url)
 
     assert result["status"] == "success"
     assert result["event_url"] == event_url
-    mock_dav_client_instance.event.assert_called_once_with(url=event_url)
-    mock_event_obj.delete.assert_called_once()
+    # The only request is a DELETE without If-Match, even though an ETag was known
+    mock_dav_client_instance.request.assert_called_once_with(event_url, "DELETE", "", {})
+
+async def test_delete_event_server_error(service, mock_dav_client_instance):
+    mock_dav_client_instance.request = MagicMock(return_value=MagicMock(status=500))
+
+    with pytest.raises(caldav.lib.error.DeleteError, match="HTTP status 500"):
+        await service.delete_event("http://dummy.url/cal1/event1.ics")
 
 # --- Task Tests ---
-@pytest.mark.asyncio
-async def test_get_tasks_success_incomplete_only(service, mock_dav_client_instance):
-    calendar_url = "http://dummy.url/cal1"
+def _mock_task_calendar(mock_dav_client_instance):
+    """A mocked Calendar that still builds real calendar-query bodies, as get_tasks() needs."""
     mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
+    real_calendar = caldav.DAVClient(url="http://dummy.url").calendar(url="http://dummy.url/cal1/")
+    mock_calendar_obj.build_search_xml_query = real_calendar.build_search_xml_query
     mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    return mock_calendar_obj
+
+async def test_get_tasks_success_incomplete_only(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = _mock_task_calendar(mock_dav_client_instance)
 
     mock_task_incomplete = MagicMock(spec=caldav.objects.Todo)
     mock_task_incomplete.url = "http://dummy.url/cal1/task1.ics"
@@ -279,8 +714,8 @@ async def test_get_tasks_success_incomplete_only(service, mock_dav_client_instan
     mock_task_completed.url = "http://dummy.url/cal1/task2.ics"
     mock_task_completed.data = SAMPLE_TASK_ICAL_COMPLETED
 
-    # .todos() is sync
-    mock_calendar_obj.todos = MagicMock(return_value=[mock_task_incomplete, mock_task_completed])
+    # .search() is sync
+    mock_calendar_obj.search = MagicMock(return_value=[mock_task_incomplete, mock_task_completed])
 
     tasks = await service.get_tasks(calendar_url, include_completed=False)
 
@@ -288,13 +723,17 @@ async def test_get_tasks_success_incomplete_only(service, mock_dav_client_instan
     assert tasks[0]["url"] == "http://dummy.url/cal1/task1.ics"
     assert tasks[0]["data"] == SAMPLE_TASK_ICAL_INCOMPLETE
     mock_dav_client_instance.calendar.assert_called_once_with(url=calendar_url)
-    mock_calendar_obj.todos.assert_called_once()
+    # One calendar-query asking the server to leave out tasks with a COMPLETED date
+    search_args = mock_calendar_obj.search.call_args.kwargs
+    assert search_args["sort_keys"] == TASK_SORT_KEYS
+    assert search_args["comp_class"] is caldav.objects.Todo
+    query = str(search_args["xml"])
+    assert '<C:prop-filter name="COMPLETED">' in query
+    assert "<C:is-not-defined/>" in query
 
-@pytest.mark.asyncio
 async def test_get_tasks_include_completed(service, mock_dav_client_instance):
     calendar_url = "http://dummy.url/cal1"
-    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
-    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj = _mock_task_calendar(mock_dav_client_instance)
 
     mock_task_incomplete = MagicMock(spec=caldav.objects.Todo)
     mock_task_incomplete.url = "http://dummy.url/cal1/task1.ics"
@@ -304,7 +743,7 @@ async def test_get_tasks_include_completed(service, mock_dav_client_instance):
     mock_task_completed.url = "http://dummy.url/cal1/task2.ics"
     mock_task_completed.data = SAMPLE_TASK_ICAL_COMPLETED
 
-    mock_calendar_obj.todos = MagicMock(return_value=[mock_task_incomplete, mock_task_completed])
+    mock_calendar_obj.search = MagicMock(return_value=[mock_task_incomplete, mock_task_completed])
 
     tasks = await service.get_tasks(calendar_url, include_completed=True)
 
@@ -312,12 +751,46 @@ async def test_get_tasks_include_completed(service, mock_dav_client_instance):
     urls = [t["url"] for t in tasks]
     assert "http://dummy.url/cal1/task1.ics" in urls
     assert "http://dummy.url/cal1/task2.ics" in urls
+    mock_calendar_obj.search.assert_called_once()
+    assert "prop-filter" not in str(mock_calendar_obj.search.call_args.kwargs["xml"])
+
+def _report_response(*objects):
+    """A 207 multistatus DAVResponse listing (path, etag, iCalendar data) objects, as a REPORT returns."""
+    responses = "".join(
+        f"<d:response><d:href>{path}</d:href><d:propstat><d:prop><d:getetag>{etag}</d:getetag>"
+        f"<c:calendar-data>{data}</c:calendar-data></d:prop><d:status>HTTP/1.1 200 OK</d:status></d:propstat></d:response>"
+        for path, etag, data in objects
+    )
+    body = f'<d:multistatus xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">{responses}</d:multistatus>'
+    raw = MagicMock(status_code=207, reason="Multi-Status", headers={"Content-Type": "application/xml"}, content=body.encode())
+    return caldav.davclient.DAVResponse(raw)
+
+async def test_get_tasks_real_search_records_etags(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1/"
+    # A real Calendar runs search(); only the REPORT request itself is mocked
+    client = caldav.DAVClient(url="http://dummy.url")
+    calendar_obj = client.calendar(url=calendar_url)
+    calendar_obj.get_property = MagicMock(return_value=None)
+    mock_dav_client_instance.calendar = MagicMock(return_value=calendar_obj)
+    client.report = MagicMock(return_value=_report_response(
+        ("/cal1/task1.ics", '"etag-1"', SAMPLE_TASK_ICAL_INCOMPLETE),
+        ("/cal1/task2.ics", '"etag-2"', SAMPLE_TASK_ICAL_COMPLETED),
+        ("/cal1/task3.ics", '"etag-3"', SAMPLE_TASK_ICAL_COMPLETED.replace("STATUS:COMPLETED", "STATUS:CANCELLED")),
+    ))
+
+    tasks = await service.get_tasks(calendar_url)
+
+    assert [t["url"] for t in tasks] == ["http://dummy.url/cal1/task1.ics"]
+    client.report.assert_called_once() # One REPORT, not the library's three pending-task queries
+    query = client.report.call_args.args[1].decode()
+    assert '<C:prop-filter name="COMPLETED">' in query # Completed tasks are filtered server-side...
+    assert "getetag" in query
+    # ...and the closed tasks the server still returned were dropped by the STATUS check
+    assert service._etags["http://dummy.url/cal1/task1.ics"] == ("VTODO", '"etag-1"')
 
-@pytest.mark.asyncio
 async def test_get_tasks_parsing_error_skip(service, mock_dav_client_instance):
     calendar_url = "http://dummy.url/cal1"
-    mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
-    mock_dav_client_instance.calendar = MagicMock(return_value=mock_calendar_obj)
+    mock_calendar_obj = _mock_task_calendar(mock_dav_client_instance)
 
     mock_task_valid = MagicMock(spec=caldav.objects.Todo)
     mock_task_valid.url = "http://dummy.url/cal1/task_valid.ics"
@@ -327,14 +800,63 @@ async def test_get_tasks_parsing_error_skip(service, mock_dav_client_instance):
     mock_task_invalid_data.url = "http://dummy.url/cal1/task_invalid.ics"
     mock_task_invalid_data.data = "BEGIN:VCALENDAR...INVALID_DATA...END:VCALENDAR" # Malformed
 
-    mock_calendar_obj.todos = MagicMock(return_value=[mock_task_valid, mock_task_invalid_data])
+    mock_calendar_obj.search = MagicMock(return_value=[mock_task_valid, mock_task_invalid_data])
 
     # When include_completed=False, parsing is attempted. Invalid task should be skipped.
     tasks = await service.get_tasks(calendar_url, include_completed=False)
     assert len(tasks) == 1
     assert tasks[0]["url"] == "http://dummy.url/cal1/task_valid.ics"
 
-@pytest.mark.asyncio
+async def test_get_tasks_skips_completed_bytes_data(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = _mock_task_calendar(mock_dav_client_instance)
+
+    # Server ignored the STATUS filter and returned CRLF-delimited bytes
+    mock_task_completed = MagicMock(spec=caldav.objects.Todo)
+    mock_task_completed.url = "http://dummy.url/cal1/task2.ics"
+    mock_task_completed.data = SAMPLE_TASK_ICAL_COMPLETED.replace("\n", "\r\n").encode()
+
+    mock_calendar_obj.search = MagicMock(return_value=[mock_task_completed])
+
+    tasks = await service.get_tasks(calendar_url, include_completed=False)
+    assert tasks == []
+
+async def test_concurrent_identical_get_tasks_share_one_fetch(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = _mock_task_calendar(mock_dav_client_instance)
+    mock_task = MagicMock(spec=caldav.objects.Todo)
+    mock_task.url = "http://dummy.url/cal1/task1.ics"
+    mock_task.data = SAMPLE_TASK_ICAL_INCOMPLETE
+    mock_calendar_obj.search = MagicMock(return_value=[mock_task])
+    mock_calendar_obj.get_property = MagicMock(return_value=None)
+
+    first, second = await asyncio.gather(service.get_tasks(calendar_url), service.get_tasks(calendar_url))
+
+    mock_calendar_obj.search.assert_called_once()
+    assert first == second
+    assert first[0] is not second[0] # Each caller gets its own copies
+    assert service._inflight == {}
+
+async def test_get_tasks_reads_status_line_exactly(service, mock_dav_client_instance):
+    calendar_url = "http://dummy.url/cal1"
+    mock_calendar_obj = _mock_task_calendar(mock_dav_client_instance)
+
+    # A STATUS parameter still marks the task completed...
+    mock_task_completed = MagicMock(spec=caldav.objects.Todo)
+    mock_task_completed.url = "http://dummy.url/cal1/task2.ics"
+    mock_task_completed.data = SAMPLE_TASK_ICAL_COMPLETED.replace("STATUS:", "status;X-PARAM=1:")
+    # ...while the word in a description does not
+    mock_task_open = MagicMock(spec=caldav.objects.Todo)
+    mock_task_open.url = "http://dummy.url/cal1/task1.ics"
+    mock_task_open.data = SAMPLE_TASK_ICAL_INCOMPLETE.replace(
+        "SUMMARY:Incomplete Task", "SUMMARY:Incomplete Task\nDESCRIPTION:Set STATUS:COMPLETED when done"
+    )
+
+    mock_calendar_obj.search = MagicMock(return_value=[mock_task_completed, mock_task_open])
+
+    tasks = await service.get_tasks(calendar_url, include_completed=False)
+    assert [task["url"] for task in tasks] == ["http://dummy.url/cal1/task1.ics"]
+
 async def test_create_task_success(service, mock_dav_client_instance):
     calendar_url = "http://dummy.url/cal1"
     mock_calendar_obj = MagicMock(spec=caldav.objects.Calendar)
@@ -351,18 +873,16 @@ async def test_create_task_success(service, mock_dav_client_instance):
     mock_calendar_obj.save_todo.assert_called_once_with(ical=SAMPLE_TASK_ICAL_INCOMPLETE)
 
 
-@pytest.mark.asyncio
 async def test_update_task_success(service, mock_dav_client_instance):
     task_url = "http://dummy.url/cal1/task1.ics"
     mock_task_obj = MagicMock(spec=caldav.objects.Todo)
     mock_task_obj.url = task_url
     mock_task_obj.save = MagicMock()
-    # Attributes for validation
-    mock_task_obj.obj = MagicMock()
-    mock_task_obj.obj.name = "VTODO"
+    # Raw data used for VTODO validation
+    mock_task_obj.data = SAMPLE_TASK_ICAL_INCOMPLETE
     mock_dav_client_instance.object_by_url = MagicMock(return_value=mock_task_obj)
 
-    new_ical_content = SAMPLE_TASK_ICAL_INCOMPLETE.replace("Incomplete Task", "Updated Incomplete Task")
+    new_ical_content = SAMPLE_TASK_ICAL_UPDATED
     result = await service.update_task(task_url, new_ical_content)
 
     assert result["status"] == "success"
@@ -371,7 +891,6 @@ async def test_update_task_success(service, mock_dav_client_instance):
     assert mock_task_obj.data == new_ical_content
     mock_task_obj.save.assert_called_once()
 
-@pytest.mark.asyncio
 async def test_update_task_not_found(service, mock_dav_client_instance):
     task_url = "http://dummy.url/cal1/nonexistenttask.ics"
     mock_dav_client_instance.object_by_url = MagicMock(return_value=None)
@@ -380,13 +899,11 @@ async def test_update_task_not_found(service, mock_dav_client_instance):
         await service.update_task(task_url, "SOME ICAL CONTENT")
     mock_dav_client_instance.object_by_url.assert_called_once_with(url=task_url)
 
-@pytest.mark.asyncio
 async def test_update_task_not_a_vtodo(service, mock_dav_client_instance):
     task_url = "http://dummy.url/cal1/event_as_task.ics"
     mock_non_task_obj = MagicMock() # Not a Todo spec
     mock_non_task_obj.url = task_url
-    mock_non_task_obj.obj = MagicMock()
-    mock_non_task_obj.obj.name = "VEVENT" # Simulate it's an event
+    mock_non_task_obj.data = SAMPLE_EVENT_ICAL # Simulate it's an event
     mock_dav_client_instance.object_by_url = MagicMock(return_value=mock_non_task_obj)
 
     with pytest.raises(ValueError, match=f"Object at URL {task_url} is not a VTODO task."):
@@ -394,15 +911,80 @@ async def test_update_task_not_a_vtodo(service, mock_dav_client_instance):
     mock_dav_client_instance.object_by_url.assert_called_once_with(url=task_url)
 
 
-@pytest.mark.asyncio
+async def _list_task_with_etag(service, mock_dav_client_instance, task_url, etag):
+    mock_calendar_obj = _mock_task_calendar(mock_dav_client_instance)
+    mock_calendar_obj.url = "http://dummy.url/cal1"
+    mock_task = MagicMock(spec=caldav.objects.Todo)
+    mock_task.url = task_url
+    mock_task.data = SAMPLE_TASK_ICAL_INCOMPLETE
+    mock_task.props = {"{DAV:}getetag": etag}
+    mock_calendar_obj.search = MagicMock(return_value=[mock_task])
+    await service.get_tasks("http://dummy.url/cal1")
+
+async def test_update_task_conditional_put_with_known_etag(service, mock_dav_client_instance):
+    task_url = "http://dummy.url/cal1/task1.ics"
+    await _list_task_with_etag(service, mock_dav_client_instance, task_url, '"etag-1"')
+
+    mock_response = MagicMock(status=204, headers={"ETag": '"etag-2"'})
+    mock_dav_client_instance.put = MagicMock(return_value=mock_response)
+    mock_dav_client_instance.object_by_url = MagicMock()
+
+    result = await service.update_task(task_url, SAMPLE_TASK_ICAL_UPDATED)
+
+    assert result == {"status": "success", "task_url": task_url}
+    put_headers = mock_dav_client_instance.put.call_args.args[2]
+    assert put_headers["If-Match"] == '"etag-1"'
+    mock_dav_client_instance.object_by_url.assert_not_called() # No fetch before saving
+    assert service._etags[task_url] == ("VTODO", '"etag-2"')
+
+async def test_update_task_identical_to_listing_skips_put(service, mock_dav_client_instance):
+    task_url = "http://dummy.url/cal1/task1.ics"
+    await _list_task_with_etag(service, mock_dav_client_instance, task_url, '"etag-1"')
+    mock_dav_client_instance.put = MagicMock()
+
+    result = await service.update_task(task_url, SAMPLE_TASK_ICAL_INCOMPLETE)
+
+    assert result == {"status": "success", "task_url": task_url, "cached": True}
+    mock_dav_client_instance.put.assert_not_called()
+
+async def test_delete_task_known_vtodo_skips_fetch(service, mock_dav_client_instance):
+    task_url = "http://dummy.url/cal1/task1.ics"
+    await _list_task_with_etag(service, mock_dav_client_instance, task_url, '"etag-1"')
+    mock_dav_client_instance.request = MagicMock(return_value=MagicMock(status=204))
+    mock_dav_client_instance.object_by_url = MagicMock()
+
+    result = await service.delete_task(task_url)
+
+    assert result == {"status": "success", "task_url": task_url}
+    mock_dav_client_instance.request.assert_called_once_with(task_url, "DELETE", "", {})
+    mock_dav_client_instance.object_by_url.assert_not_called()
+
+async def test_update_task_precondition_failed_falls_back(service, mock_dav_client_instance):
+    task_url = "http://dummy.url/cal1/task1.ics"
+    await _list_task_with_etag(service, mock_dav_client_instance, task_url, '"stale"')
+
+    mock_dav_client_instance.put = MagicMock(return_value=MagicMock(status=412, headers={}))
+    mock_task_obj = MagicMock(spec=caldav.objects.Todo)
+    mock_task_obj.url = task_url
+    mock_task_obj.data = SAMPLE_TASK_ICAL_INCOMPLETE
+    mock_task_obj.save = MagicMock()
+    mock_dav_client_instance.object_by_url = MagicMock(return_value=mock_task_obj)
+
+    result = await service.update_task(task_url, SAMPLE_TASK_ICAL_UPDATED)
+
+    assert result["status"] == "success"
+    mock_dav_client_instance.object_by_url.assert_called_once_with(url=task_url)
+    mock_task_obj.save.assert_called_once()
+    assert task_url not in service._etags
+
+
 async def test_delete_task_success(service, mock_dav_client_instance):
     task_url = "http://dummy.url/cal1/task1.ics"
     mock_task_obj = MagicMock(spec=caldav.objects.Todo)
     mock_task_obj.url = task_url # Set url attribute for the error message if not VTODO
     mock_task_obj.delete = MagicMock()
-    # Attributes for validation
-    mock_task_obj.obj = MagicMock()
-    mock_task_obj.obj.name = "VTODO"
+    # Raw data used for VTODO validation
+    mock_task_obj.data = SAMPLE_TASK_ICAL_INCOMPLETE
     mock_dav_client_instance.object_by_url = MagicMock(return_value=mock_task_obj)
 
     result = await service.delete_task(task_url)
@@ -412,7 +994,6 @@ async def test_delete_task_success(service, mock_dav_client_instance):
     mock_dav_client_instance.object_by_url.assert_called_once_with(url=task_url)
     mock_task_obj.delete.assert_called_once()
 
-@pytest.mark.asyncio
 async def test_delete_task_not_found(service, mock_dav_client_instance):
     task_url = "http://dummy.url/cal1/nonexistenttask.ics"
     mock_dav_client_instance.object_by_url = MagicMock(return_value=None)
@@ -421,15 +1002,97 @@ async def test_delete_task_not_found(service, mock_dav_client_instance):
         await service.delete_task(task_url)
     mock_dav_client_instance.object_by_url.assert_called_once_with(url=task_url)
 
-@pytest.mark.asyncio
 async def test_delete_task_not_a_vtodo(service, mock_dav_client_instance):
     task_url = "http://dummy.url/cal1/event_as_task.ics"
     mock_non_task_obj = MagicMock() # Not a Todo spec
     mock_non_task_obj.url = task_url
-    mock_non_task_obj.obj = MagicMock()
-    mock_non_task_obj.obj.name = "VEVENT" # Simulate it's an event
+    mock_non_task_obj.data = SAMPLE_EVENT_ICAL # Simulate it's an event
     mock_dav_client_instance.object_by_url = MagicMock(return_value=mock_non_task_obj)
 
     with pytest.raises(ValueError, match=f"Object at URL {task_url} is not a VTODO task."):
         await service.delete_task(task_url)
     mock_dav_client_instance.object_by_url.assert_called_once_with(url=task_url)
+
+
+async def test_delete_events_batch(service, mock_dav_client_instance):
+    urls = ["http://dummy.url/cal1/event1.ics", "http://dummy.url/cal1/gone.ics", "http://dummy.url/cal1/changed.ics"]
+    statuses = {urls[0]: 204, urls[1]: 404, urls[2]: 412}
+    mock_dav_client_instance.request = MagicMock(
+        side_effect=lambda url, method, body, headers: MagicMock(status=statuses[url])
+    )
+
+    results = await service.delete_events(urls)
+
+    assert results == [
+        {"status": "success", "event_url": urls[0]},
+        {"status": "success", "event_url": urls[1]}, # Already gone, as delete_event() treats it
+        {"status": "error", "event_url": urls[2], "message": "Server returned HTTP status 412"},
+    ]
+    # The only requests are one unconditional DELETE per URL, since none was listed
+    mock_dav_client_instance.request.assert_has_calls([call(url, "DELETE", "", {}) for url in urls], any_order=True)
+    assert mock_dav_client_instance.request.call_count == 3
+
+async def test_delete_tasks_batch_skips_fetch_for_known_tasks(service, mock_dav_client_instance):
+    known_url = "http://dummy.url/cal1/task1.ics"
+    unknown_url = "http://dummy.url/cal1/other.ics"
+    await _list_task_with_etag(service, mock_dav_client_instance, known_url, '"etag-1"')
+
+    mock_dav_client_instance.request = MagicMock(return_value=MagicMock(status=204))
+    mock_dav_client_instance.object_by_url = MagicMock(return_value=None) # Unknown URL does not exist
+
+    results = await service.delete_tasks([known_url, unknown_url])
+
+    assert results[0] == {"status": "success", "task_url": known_url}
+    assert results[1]["status"] == "error"
+    assert "Task not found" in results[1]["message"]
+    mock_dav_client_instance.request.assert_called_once_with(known_url, "DELETE", "", {"If-Match": '"etag-1"'})
+    mock_dav_client_instance.object_by_url.assert_called_once_with(url=unknown_url)
+
+async def test_get_tasks_multi_keeps_going_past_failures(service, mock_dav_client_instance):
+    good_url, bad_url = "http://dummy.url/cal1", "http://dummy.url/broken"
+    mock_task = MagicMock(spec=caldav.objects.Todo)
+    mock_task.url = "http://dummy.url/cal1/task1.ics"
+    mock_task.data = SAMPLE_TASK_ICAL_INCOMPLETE
+
+    def _calendar(url):
+        calendar_obj = _mock_task_calendar(MagicMock())
+        if url == bad_url:
+            calendar_obj.search = MagicMock(side_effect=caldav.lib.error.NotFoundError("gone"))
+        else:
+            calendar_obj.search = MagicMock(return_value=[mock_task])
+        return calendar_obj
+    mock_dav_client_instance.calendar = MagicMock(side_effect=_calendar)
+
+    results = await service.get_tasks_multi([good_url, bad_url])
+
+    assert results[0]["status"] == "success"
+    assert results[0]["calendar_url"] == good_url
+    assert [task["url"] for task in results[0]["tasks"]] == [mock_task.url]
+    assert results[1]["status"] == "error"
+    assert results[1]["calendar_url"] == bad_url
+    assert "gone" in results[1]["message"]
+
+def test_lazy_ical_parses_on_demand():
+    data = LazyICal(SAMPLE_EVENT_ICAL)
+    assert data == SAMPLE_EVENT_ICAL
+    assert isinstance(data, str)
+    assert not hasattr(data, '_parsed') # Nothing parsed until asked for
+
+    with patch('caldav_service.Calendar.from_ical', wraps=ICalCalendar.from_ical) as mock_from_ical:
+        assert data.parsed() is data.parsed()
+        mock_from_ical.assert_called_once() # Parsed once, then memoized
+
+    assert LazyICal(SAMPLE_EVENT_ICAL.encode()) == SAMPLE_EVENT_ICAL
+
+def test_lazy_ical_shares_parse_by_url_and_etag():
+    key = ("http://dummy.url/cal1/event1.ics", '"etag-1"')
+    with patch('caldav_service.Calendar.from_ical', wraps=ICalCalendar.from_ical) as mock_from_ical:
+        first = LazyICal(SAMPLE_EVENT_ICAL, cache_key=key).parsed()
+        # A later fetch of the same unchanged object reuses the parse
+        second = LazyICal(SAMPLE_EVENT_ICAL, cache_key=key).parsed()
+        assert first is second
+        mock_from_ical.assert_called_once()
+
+        # A new ETag is a new key
+        LazyICal(SAMPLE_EVENT_ICAL, cache_key=(key[0], '"etag-2"')).parsed()
+        assert mock_from_ical.call_count == 2
@@ -1,143 +1,183 @@
 import pytest
 import json
-import importlib
+import logging
+import inspect
+import requests
+from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock, AsyncMock, call
 
-# Ensure server can be imported. This might require PYTHONPATH adjustments in the execution environment.
-# For this subtask, assume 'server.py' is in a location where it can be imported.
-# If server.py is in the parent directory, and tests/ is a subdir,
-# this might need `sys.path.append('..')` or similar, but let's try direct import first.
-try:
-    import server
-except ImportError:
-    # If direct import fails, try adjusting path if this were a local dev scenario.
-    # For the tool environment, this should ideally be handled by how the sandbox is set up.
-    import sys
-    sys.path.append('../') # Assuming tests/ is a subdirectory of the project root
-    import server
+import server # tests/conftest.py puts the project root on sys.path
+
+from caldav_service import CalDAVService as RealCalDAVService # server.CalDAVService is patched in tests
+
+# The server tests do no real I/O, so they share one event loop. Every test here is a
+# coroutine, since the module-wide asyncio mark would warn on plain functions.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# CALDAV_ACCOUNTS payloads shared by several tests, serialized once
+ACCOUNTS_JSON_EMPTY = "[]"
+ACCOUNTS_JSON_SINGLE = json.dumps([{"url": "http://caldav.test/dav", "username": "user", "password": "pw"}])
+ACCOUNTS_JSON_REAL = json.dumps([{"url": "http://real.account/dav", "username": "user", "password": "pw"}])
+
+# Date range for the list_caldav_events tests, as sent by the client and as parsed by server.py
+START_DATE_STR = "2024-01-01"
+END_DATE_STR = "2024-01-31"
+START_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END_DATE = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+
+def _not_found(account_identifier, container=list):
+    """Returns the error a tool wrapped with _tool_errors(container) gives for an unknown account."""
+    error = {"status": "error", "message": f"Account identifier '{account_identifier}' not found."}
+    return [error] if container is list else error
+
+
+# Return value factories for the service methods the tools call; AsyncMock children are already awaitable
+_DEFAULT_SERVICE_RETURNS = {
+    'get_calendars': list, 'get_events': list, 'create_event': dict, 'update_event': dict, 'delete_event': dict,
+    'get_tasks': list, 'create_task': dict, 'update_task': dict, 'delete_task': dict,
+    'get_events_multi': list, 'create_events': list, 'delete_events': list, 'get_tasks_multi': list, 'delete_tasks': list,
+}
 
 
 # Fixture to provide a mock CalDAVService class.
 # This mock will be used to replace the actual CalDAVService class.
-@pytest.fixture
-def mock_caldav_service_class(mocker):
+# The spec'd patch is built once per module; mock_caldav_service_class resets it per test.
+@pytest.fixture(scope="module")
+def _caldav_service_class_patch(request):
     """
     Mocks the caldav_service.CalDAVService class.
     The constructor of this mock class will return new AsyncMock instances,
     allowing us to simulate multiple CalDAVService objects.
     """
-    CalDAVServiceMock = mocker.patch('caldav_service.CalDAVService', spec=True)
+    class_patcher = patch('caldav_service.CalDAVService', spec_set=True)
+    CalDAVServiceMock = class_patcher.start()
+    request.addfinalizer(class_patcher.stop)
+    server_patcher = patch.object(server, 'CalDAVService', CalDAVServiceMock)
+    server_patcher.start()
+    request.addfinalizer(server_patcher.stop)
 
     # Define a side_effect function for the constructor.
     # This function will be called whenever CalDAVService() is instantiated in server.py
-    def service_constructor_mock(url, username, password):
-        instance = AsyncMock(spec=server.CalDAVService) # Use the actual class for spec
+    def service_constructor_mock(url, username, password, **kwargs):
+        instance = AsyncMock() # Only the configured methods are exercised, so skip the spec walk
+        # Default mock methods for the instance
+        instance.configure_mock(**{f"{name}.return_value": factory() for name, factory in _DEFAULT_SERVICE_RETURNS.items()})
         instance.url = url # Store for identification
         instance.username = username
         instance.password = password # Though not used in current tests, good practice
-
-        # Default mock methods for the instance
-        instance.get_calendars = AsyncMock(return_value=[])
-        instance.get_events = AsyncMock(return_value=[])
-        instance.create_event = AsyncMock(return_value={})
-        instance.update_event = AsyncMock(return_value={})
-        instance.delete_event = AsyncMock(return_value={})
-        instance.get_tasks = AsyncMock(return_value=[])
-        instance.create_task = AsyncMock(return_value={})
-        instance.update_task = AsyncMock(return_value={})
-        instance.delete_task = AsyncMock(return_value={})
         return instance
 
     CalDAVServiceMock.side_effect = service_constructor_mock
     return CalDAVServiceMock
 
 
+@pytest.fixture
+def mock_caldav_service_class(_caldav_service_class_patch):
+    """
+    Returns the module-wide CalDAVService mock with its call history cleared.
+    """
+    _caldav_service_class_patch.reset_mock(return_value=False, side_effect=False)
+    return _caldav_service_class_patch
+
+
+@pytest.fixture
+def configure_accounts(mock_caldav_service_class, monkeypatch):
+    """
+    Returns a function that points server.caldav_services_map at mocked services
+    for the given CALDAV_ACCOUNTS JSON, without reloading the server module.
+    """
+    def configure(accounts_json):
+        services_map = server._init_caldav_services_map(accounts_json)
+        monkeypatch.setattr(server, 'caldav_services_map', services_map)
+        return services_map
+    return configure
+
+
+@pytest.fixture
+def single_account(configure_accounts):
+    """
+    Configures the single ACCOUNTS_JSON_SINGLE account and returns its mocked service and URL.
+    """
+    account_url = "http://caldav.test/dav"
+    return configure_accounts(ACCOUNTS_JSON_SINGLE)[account_url], account_url
+
+
+@pytest.fixture
+def mock_from_ical(monkeypatch):
+    """
+    Replaces icalendar.Calendar.from_ical so validation never really parses.
+    """
+    from_ical = MagicMock(return_value=MagicMock()) # Just needs to not raise error
+    monkeypatch.setattr('icalendar.Calendar.from_ical', from_ical)
+    return from_ical
+
+
 # --- Tests for caldav_services_map initialization ---
 
-@pytest.mark.asyncio
-async def test_init_valid_multiple_accounts(mock_caldav_service_class):
+async def test_init_valid_multiple_accounts(mock_caldav_service_class, configure_accounts):
     accounts_data = [
         {"url": "http://caldav1.com/dav", "username": "user1", "password": "pw1"},
         {"url": "http://caldav2.com/dav", "username": "user2", "password": "pw2"},
     ]
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps(accounts_data)
-        importlib.reload(server) # Reload server to pick up mocked env
+    configure_accounts(json.dumps(accounts_data))
 
     assert len(server.caldav_services_map) == 2
     assert "http://caldav1.com/dav" in server.caldav_services_map
     assert "http://caldav2.com/dav" in server.caldav_services_map
     # Check if constructor was called with correct args
-    mock_caldav_service_class.assert_any_call(url="http://caldav1.com/dav", username="user1", password="pw1")
-    mock_caldav_service_class.assert_any_call(url="http://caldav2.com/dav", username="user2", password="pw2")
+    mock_caldav_service_class.assert_any_call(url="http://caldav1.com/dav", username="user1", password="pw1", max_workers=server.CALDAV_THREAD_POOL_SIZE)
+    mock_caldav_service_class.assert_any_call(url="http://caldav2.com/dav", username="user2", password="pw2", max_workers=server.CALDAV_THREAD_POOL_SIZE)
 
-@pytest.mark.asyncio
-async def test_init_empty_caldav_accounts(mock_caldav_service_class):
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = "[]" # Empty list
-        importlib.reload(server)
+async def test_init_empty_caldav_accounts(mock_caldav_service_class, configure_accounts):
+    configure_accounts(ACCOUNTS_JSON_EMPTY)
 
     assert not server.caldav_services_map
     mock_caldav_service_class.assert_not_called()
 
-@pytest.mark.asyncio
-async def test_init_no_caldav_accounts_env_var(mock_caldav_service_class, caplog):
+async def test_init_no_caldav_accounts_env_var(mock_caldav_service_class, monkeypatch, caplog):
     # server.py defaults to "[]" if CALDAV_ACCOUNTS is not set
-    with patch('os.getenv') as mock_getenv:
-        def getenv_side_effect(key, default=None):
-            if key == "CALDAV_ACCOUNTS":
-                return None # Simulate it not being set
-            return default
-        mock_getenv.side_effect = getenv_side_effect
-        importlib.reload(server)
+    monkeypatch.delenv("CALDAV_ACCOUNTS", raising=False)
+    caplog.set_level(logging.WARNING, logger=server.logger.name)
+    services_map = server._init_caldav_services_map(server.os.getenv("CALDAV_ACCOUNTS", "[]"))
 
-    assert not server.caldav_services_map
+    assert not services_map
     mock_caldav_service_class.assert_not_called()
     # A warning is logged if the map is empty after init.
     assert any("No CalDAV accounts configured" in record.message for record in caplog.records if record.levelname == "WARNING")
 
 
-@pytest.mark.asyncio
 async def test_init_malformed_json_caldav_accounts(mock_caldav_service_class, caplog):
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = "this is not valid json"
-        # Need to explicitly set log level for the server's logger for caplog to catch it
-        server.logger.setLevel("ERROR")
-        importlib.reload(server)
+    caplog.set_level(logging.ERROR, logger=server.logger.name)
+    services_map = server._init_caldav_services_map("this is not valid json")
 
-    assert not server.caldav_services_map
+    assert not services_map
     mock_caldav_service_class.assert_not_called()
     assert any("Failed to parse CALDAV_ACCOUNTS JSON" in record.message for record in caplog.records if record.levelname == "ERROR")
 
-@pytest.mark.asyncio
 async def test_init_incomplete_account_details(mock_caldav_service_class, caplog):
     accounts_data = [
         {"url": "http://complete.com/dav", "username": "user1", "password": "pw1"},
         {"username": "user2", "password": "pw2"}, # Missing URL
         {"url": "http://incomplete3.com/dav", "password": "pw3"}, # Missing username
     ]
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps(accounts_data)
-        server.logger.setLevel("ERROR") # To capture error logs for invalid configs
-        importlib.reload(server)
-
-    assert len(server.caldav_services_map) == 1 # Only the complete one
-    assert "http://complete.com/dav" in server.caldav_services_map
-    mock_caldav_service_class.assert_called_once_with(url="http://complete.com/dav", username="user1", password="pw1")
+    caplog.set_level(logging.ERROR, logger=server.logger.name)
+    services_map = server._init_caldav_services_map(json.dumps(accounts_data))
+
+    assert len(services_map) == 1 # Only the complete one
+    assert "http://complete.com/dav" in services_map
+    mock_caldav_service_class.assert_called_once_with(url="http://complete.com/dav", username="user1", password="pw1", max_workers=server.CALDAV_THREAD_POOL_SIZE)
     assert any("Invalid account configuration found" in record.message for record in caplog.records if record.levelname == "ERROR")
 
 
 # --- Tests for list_caldav_calendars tool ---
 
-@pytest.mark.asyncio
-async def test_list_calendars_multiple_accounts_success(mock_caldav_service_class):
+async def test_list_calendars_multiple_accounts_success(configure_accounts):
     accounts_data = [
         {"url": "http://acc1.com/dav", "username": "u1", "password": "p1"},
         {"url": "http://acc2.com/dav", "username": "u2", "password": "p2"},
     ]
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps(accounts_data)
-        importlib.reload(server)
+    configure_accounts(json.dumps(accounts_data))
 
     # Configure the mock instances created by server.py
     service1 = server.caldav_services_map["http://acc1.com/dav"]
@@ -154,16 +194,13 @@ async def test_list_calendars_multiple_accounts_success(mock_caldav_service_clas
     service1.get_calendars.assert_called_once()
     service2.get_calendars.assert_called_once()
 
-@pytest.mark.asyncio
-async def test_list_calendars_one_service_fails(mock_caldav_service_class, caplog):
+async def test_list_calendars_one_service_fails(configure_accounts, caplog):
     accounts_data = [
         {"url": "http://ok.com/dav", "username": "ok_user", "password": "p_ok"},
         {"url": "http://fail.com/dav", "username": "fail_user", "password": "p_fail"},
     ]
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps(accounts_data)
-        server.logger.setLevel("ERROR") # To capture CalDAVConnectionError log
-        importlib.reload(server)
+    caplog.set_level(logging.ERROR, logger=server.logger.name)
+    configure_accounts(json.dumps(accounts_data))
 
     service_ok = server.caldav_services_map["http://ok.com/dav"]
     service_ok.get_calendars = AsyncMock(return_value=[{'name': 'OK Cal', 'url': 'http://ok.com/dav/cal_ok'}])
@@ -179,140 +216,119 @@ async def test_list_calendars_one_service_fails(mock_caldav_service_class, caplo
     service_fail.get_calendars.assert_called_once()
     assert any("CalDAV connection error for account http://fail.com/dav" in record.message for record in caplog.records if record.levelname == "ERROR")
 
-@pytest.mark.asyncio
-async def test_list_calendars_no_accounts_configured(mock_caldav_service_class):
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = "[]"
-        importlib.reload(server)
+async def test_list_calendars_no_accounts_configured(configure_accounts):
+    configure_accounts(ACCOUNTS_JSON_EMPTY)
 
     result = await server.list_caldav_calendars()
     assert result == []
 
 # --- Tests for tools like list_caldav_events ---
 
-@pytest.mark.asyncio
-async def test_list_events_valid_account(mock_caldav_service_class):
-    account_url = "http://caldav.test/dav"
+async def test_list_events_valid_account(single_account):
+    mocked_service, account_url = single_account
     calendar_url_to_test = f"{account_url}/cal1"
 
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps([{"url": account_url, "username": "user", "password": "pw"}])
-        importlib.reload(server)
-
-    mocked_service = server.caldav_services_map[account_url]
     expected_events = [{"summary": "Test Event", "url": f"{calendar_url_to_test}/event1.ics"}]
     mocked_service.get_events = AsyncMock(return_value=expected_events)
 
-    start_date_str = "2024-01-01"
-    end_date_str = "2024-01-31"
-
-    # Convert string dates to datetime objects for assertion, as server.py does this conversion
-    from datetime import datetime
-    import pytz
-    s_date_obj = datetime.strptime(start_date_str, '%Y-%m-%d').replace(tzinfo=pytz.UTC)
-    e_date_obj = datetime.strptime(end_date_str, '%Y-%m-%d').replace(tzinfo=pytz.UTC)
-
-
     result = await server.list_caldav_events(
         account_identifier=account_url,
         calendar_url=calendar_url_to_test,
-        start_date=start_date_str,
-        end_date=end_date_str
+        start_date=START_DATE_STR,
+        end_date=END_DATE_STR
     )
 
     assert result == expected_events
-    mocked_service.get_events.assert_called_once_with(calendar_url_to_test, s_date_obj, e_date_obj)
+    mocked_service.get_events.assert_called_once_with(calendar_url_to_test, START_DATE, END_DATE, only_props=None)
 
-@pytest.mark.asyncio
-async def test_list_events_invalid_account(mock_caldav_service_class):
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps([{"url": "http://real.account/dav", "username": "user", "password": "pw"}])
-        importlib.reload(server)
+# --- Tests for tools like create_caldav_event ---
 
-    result = await server.list_caldav_events(account_identifier="http://fake.account/dav", calendar_url="http://fake.account/dav/cal1")
+async def test_create_event_valid_account(single_account, mock_from_ical):
+    mocked_service, account_url = single_account
+    calendar_url_to_test = f"{account_url}/cal1"
+    ical_content = "BEGIN:VCALENDAR..."
 
-    expected_error = [{"status": "error", "message": "Account identifier 'http://fake.account/dav' not found."}]
-    assert result == expected_error
+    expected_response = {"status": "success", "event_url": f"{calendar_url_to_test}/newevent.ics"}
+    mocked_service.create_event = AsyncMock(return_value=expected_response)
 
-    # Ensure no service's get_events was called
-    if server.caldav_services_map: # It will have one entry
-        real_service = server.caldav_services_map["http://real.account/dav"]
-        real_service.get_events.assert_not_called()
+    result = await server.create_caldav_event(
+        account_identifier=account_url,
+        calendar_url=calendar_url_to_test,
+        ical_content=ical_content
+    )
 
+    assert result == expected_response
+    mocked_service.create_event.assert_called_once_with(calendar_url_to_test, ical_content)
+    mock_from_ical.assert_called_once_with(ical_content)
 
-@pytest.mark.asyncio
-async def test_list_events_no_accounts_configured(mock_caldav_service_class):
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = "[]"
-        importlib.reload(server)
 
-    # Attempt to call list_events, it should fail because account_identifier won't be found
-    result = await server.list_caldav_events(account_identifier="http://any.account/dav", calendar_url="http://any.account/dav/cal1")
-    expected_error = [{"status": "error", "message": "Account identifier 'http://any.account/dav' not found."}]
-    assert result == expected_error
+async def test_create_events_keeps_order_of_valid_and_invalid_payloads(single_account):
+    mocked_service, account_url = single_account
+    calendar_url_to_test = f"{account_url}/cal1"
+    ical_contents = [VALID_EVENT_ICAL, "not an icalendar payload", VALID_EVENT_ICAL.replace("UID:1", "UID:2")]
+    mocked_service.create_events.return_value = [
+        {"status": "success", "event_url": f"{calendar_url_to_test}/a.ics"},
+        {"status": "error", "message": "Rejected"},
+    ]
 
-# --- Tests for tools like create_caldav_event ---
+    result = await server.create_caldav_events(
+        account_identifier=account_url, calendar_url=calendar_url_to_test, ical_contents=ical_contents
+    )
 
-@pytest.mark.asyncio
-async def test_create_event_valid_account(mock_caldav_service_class):
-    account_url = "http://caldav.test/dav"
-    calendar_url_to_test = f"{account_url}/cal1"
-    ical_content = "BEGIN:VCALENDAR..."
+    # Only the valid payloads are sent, and each result lands back at its payload's index
+    mocked_service.create_events.assert_awaited_once_with(calendar_url_to_test, [ical_contents[0], ical_contents[2]])
+    assert result[0] == {"status": "success", "event_url": f"{calendar_url_to_test}/a.ics"}
+    assert result[1]["status"] == "error" and result[1]["message"].startswith("Invalid iCalendar content")
+    assert result[2] == {"status": "error", "message": "Rejected"}
 
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps([{"url": account_url, "username": "user", "password": "pw"}])
-        importlib.reload(server)
+async def test_create_events_all_invalid_sends_nothing(single_account):
+    mocked_service, account_url = single_account
 
-    mocked_service = server.caldav_services_map[account_url]
-    expected_response = {"status": "success", "event_url": f"{calendar_url_to_test}/newevent.ics"}
-    mocked_service.create_event = AsyncMock(return_value=expected_response)
+    result = await server.create_caldav_events(
+        account_identifier=account_url, calendar_url=f"{account_url}/cal1", ical_contents=["not an icalendar payload"]
+    )
 
-    # Mock icalendar.Calendar.from_ical to prevent actual parsing
-    with patch('icalendar.Calendar.from_ical') as mock_from_ical:
-        mock_from_ical.return_value = MagicMock() # Just needs to not raise error
+    assert [entry["status"] for entry in result] == ["error"]
+    mocked_service.create_events.assert_not_called()
 
-        result = await server.create_caldav_event(
-            account_identifier=account_url,
-            calendar_url=calendar_url_to_test,
-            ical_content=ical_content
-        )
+# --- Tests for the multi-calendar listing tools ---
 
-    assert result == expected_response
-    mocked_service.create_event.assert_called_once_with(calendar_url_to_test, ical_content)
-    mock_from_ical.assert_called_once_with(ical_content)
+async def test_list_events_multi_passes_parsed_dates(single_account):
+    mocked_service, account_url = single_account
+    calendar_urls = [f"{account_url}/cal1", f"{account_url}/cal2"]
+    expected = [
+        {"status": "success", "calendar_url": calendar_urls[0], "events": []},
+        {"status": "error", "calendar_url": calendar_urls[1], "message": "gone"},
+    ]
+    mocked_service.get_events_multi.return_value = expected
 
+    result = await server.list_caldav_events_multi(
+        account_identifier=account_url, calendar_urls=calendar_urls, start_date=START_DATE_STR, end_date=END_DATE_STR
+    )
 
-@pytest.mark.asyncio
-async def test_create_event_invalid_account(mock_caldav_service_class):
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps([{"url": "http://real.account/dav", "username": "user", "password": "pw"}])
-        importlib.reload(server)
+    assert result == expected
+    mocked_service.get_events_multi.assert_awaited_once_with(calendar_urls, START_DATE, END_DATE, only_props=None)
 
-    result = await server.create_caldav_event(
-        account_identifier="http://fake.account/dav",
-        calendar_url="http://fake.account/dav/cal1",
-        ical_content="BEGIN:VCALENDAR..."
+async def test_list_tasks_multi_passes_arguments(single_account):
+    mocked_service, account_url = single_account
+    calendar_urls = [f"{account_url}/cal1", f"{account_url}/cal2"]
+    expected = [{"status": "success", "calendar_url": url, "tasks": []} for url in calendar_urls]
+    mocked_service.get_tasks_multi.return_value = expected
+
+    result = await server.list_caldav_tasks_multi(
+        account_identifier=account_url, calendar_urls=calendar_urls, include_completed=True, only_props=["SUMMARY"]
     )
 
-    expected_error = {"status": "error", "message": "Account identifier 'http://fake.account/dav' not found."}
-    assert result == expected_error
+    assert result == expected
+    mocked_service.get_tasks_multi.assert_awaited_once_with(calendar_urls, True, only_props=["SUMMARY"])
 
-    if server.caldav_services_map:
-        real_service = server.caldav_services_map["http://real.account/dav"]
-        real_service.create_event.assert_not_called()
 
 # --- Tests for task-related tools like list_caldav_tasks ---
 
-@pytest.mark.asyncio
-async def test_list_tasks_valid_account(mock_caldav_service_class):
-    account_url = "http://caldav.tasks/dav"
+async def test_list_tasks_valid_account(single_account):
+    mocked_service, account_url = single_account
     calendar_url_to_test = f"{account_url}/tasks_cal"
 
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps([{"url": account_url, "username": "task_user", "password": "tpw"}])
-        importlib.reload(server)
-
-    mocked_service = server.caldav_services_map[account_url]
     expected_tasks = [{"summary": "Test Task", "url": f"{calendar_url_to_test}/task1.ics"}]
     mocked_service.get_tasks = AsyncMock(return_value=expected_tasks)
 
@@ -323,23 +339,161 @@ async def test_list_tasks_valid_account(mock_caldav_service_class):
     )
 
     assert result == expected_tasks
-    mocked_service.get_tasks.assert_called_once_with(calendar_url_to_test, True)
+    mocked_service.get_tasks.assert_called_once_with(calendar_url_to_test, True, only_props=None)
 
 
-@pytest.mark.asyncio
-async def test_list_tasks_invalid_account(mock_caldav_service_class):
-    with patch('os.getenv') as mock_getenv:
-        mock_getenv.return_value = json.dumps([{"url": "http://real.tasks/dav", "username": "user", "password": "pw"}])
-        importlib.reload(server)
+# --- Tests for the batch deletion tools ---
 
-    result = await server.list_caldav_tasks(
-        account_identifier="http://fake.tasks/dav",
-        calendar_url="http://fake.tasks/dav/cal1"
-    )
+@pytest.mark.parametrize("tool_name,urls_arg,service_method,url_key", [
+    ("delete_caldav_events", "event_urls", "delete_events", "event_url"),
+    ("delete_caldav_tasks", "task_urls", "delete_tasks", "task_url"),
+])
+async def test_batch_delete_tools_return_per_url_results(single_account, tool_name, urls_arg, service_method, url_key):
+    mocked_service, account_url = single_account
+    urls = [f"{account_url}/cal1/a.ics", f"{account_url}/cal1/b.ics"]
+    expected = [
+        {"status": "success", url_key: urls[0]},
+        {"status": "error", url_key: urls[1], "message": "Server returned HTTP status 412"},
+    ]
+    getattr(mocked_service, service_method).return_value = expected
+
+    result = await getattr(server, tool_name)(account_identifier=account_url, **{urls_arg: urls})
+
+    assert result == expected
+    getattr(mocked_service, service_method).assert_awaited_once_with(urls)
+
+async def test_batch_delete_tool_reports_connection_error(single_account):
+    mocked_service, account_url = single_account
+    mocked_service.delete_events.side_effect = server.CalDAVConnectionError("down")
+
+    result = await server.delete_caldav_events(account_identifier=account_url, event_urls=[f"{account_url}/cal1/a.ics"])
+
+    assert result == [{"status": "error", "message": f"CalDAV connection error for account {account_url}: down"}]
+
+
+# --- Tests for unknown account identifiers ---
+
+INVALID_ACCOUNT_CASES = [
+    ("list_caldav_events", {"calendar_url": "http://fake.account/dav/cal1"}, "get_events", list),
+    ("create_caldav_event", {"calendar_url": "http://fake.account/dav/cal1", "ical_content": "BEGIN:VCALENDAR..."}, "create_event", dict),
+    ("list_caldav_tasks", {"calendar_url": "http://fake.account/dav/cal1"}, "get_tasks", list),
+]
+
+@pytest.mark.parametrize("accounts_json", [ACCOUNTS_JSON_REAL, ACCOUNTS_JSON_EMPTY])
+@pytest.mark.parametrize("tool_name,kwargs,service_method,container", INVALID_ACCOUNT_CASES)
+async def test_invalid_account(configure_accounts, accounts_json, tool_name, kwargs, service_method, container):
+    configure_accounts(accounts_json)
+
+    result = await getattr(server, tool_name)(account_identifier="http://fake.account/dav", **kwargs)
+
+    assert result == _not_found("http://fake.account/dav", container)
+
+    # Ensure no service was called
+    for real_service in server.caldav_services_map.values():
+        getattr(real_service, service_method).assert_not_called()
+
+
+# --- Tests for the server lifespan ---
+
+async def test_lifespan_closes_services():
+    service_instance = AsyncMock(spec=RealCalDAVService)
+    with patch.dict(server.caldav_services_map, {"http://caldav1.com/dav": service_instance}, clear=True):
+        async with server.app_lifespan(server.mcp):
+            service_instance.aclose.assert_not_awaited()
+
+    service_instance.aclose.assert_awaited_once()
+
+
+# --- Tests for iCalendar validation ---
+
+VALID_EVENT_ICAL = (
+    "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Test//EN\r\nBEGIN:VEVENT\r\nUID:1\r\n"
+    "DTSTART;TZID=Europe/Paris:20240101T100000\r\nSUMMARY:Long\r\n  folded line\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+)
+
+async def test_well_formed_ical_skips_full_parse(mock_from_ical):
+    assert server._ical_error(VALID_EVENT_ICAL, "VEVENT") is None
+    mock_from_ical.assert_not_called()
+
+async def test_oversized_ical_rejected_before_scanning():
+    with patch.object(server, 'CALDAV_MAX_ICAL_SIZE', 10), patch.object(server, '_is_well_formed') as mock_check:
+        assert "larger than 10 characters" in server._ical_error(VALID_EVENT_ICAL, "VEVENT")
+    mock_check.assert_not_called()
+
+async def test_malformed_ical_reports_parser_error():
+    assert server._ical_error("not an icalendar payload", "VEVENT") is not None
+    # Missing the required component or unbalanced markers fail the fast check
+    assert not server._is_well_formed(VALID_EVENT_ICAL, "VTODO")
+    assert not server._is_well_formed(VALID_EVENT_ICAL.replace("END:VEVENT\r\n", ""), "VEVENT")
+
+
+# --- Tests for the tool error decorator and circuit breaker ---
+
+async def test_tool_errors_returns_error_structures():
+    @server._tool_errors(list)
+    async def failing_list(account_identifier, service):
+        raise server.CalDAVConnectionError("down")
+
+    @server._tool_errors(dict)
+    async def failing_dict(account_identifier, service):
+        raise RuntimeError("boom")
+
+    account = "http://acc.test/dav"
+    with patch.dict(server.caldav_services_map, {account: MagicMock()}):
+        assert await failing_list(account) == [
+            {"status": "error", "message": "CalDAV connection error for account http://acc.test/dav: down"}
+        ]
+        assert await failing_dict(account_identifier=account) == {
+            "status": "error", "message": "An unexpected error occurred for account http://acc.test/dav: boom"
+        }
+    assert await failing_dict("http://unknown.test/dav") == _not_found("http://unknown.test/dav", dict)
+
+async def test_tool_errors_injects_service_and_hides_it_from_schema():
+    service_mock = MagicMock()
+
+    @server._tool_errors(dict)
+    async def tool(account_identifier: str, service, calendar_url: str) -> dict:
+        return {"service": service, "calendar_url": calendar_url}
+
+    with patch.dict(server.caldav_services_map, {"http://acc.test/dav": service_mock}):
+        result = await tool(account_identifier="http://acc.test/dav", calendar_url="http://acc.test/cal")
+    assert result == {"service": service_mock, "calendar_url": "http://acc.test/cal"}
+    assert list(inspect.signature(tool).parameters) == ["account_identifier", "calendar_url"]
+
+async def test_circuit_breaker_fails_fast_then_probes():
+    calls = []
+
+    @server._tool_errors(dict)
+    async def tool(account_identifier, service):
+        calls.append(account_identifier)
+        if len(calls) <= 2:
+            raise server.CalDAVConnectionError("down")
+        return {"status": "success"}
+
+    account = "http://breaker.test/dav"
+    with patch.object(server, 'CALDAV_BREAKER_THRESHOLD', 2), patch.object(server, 'CALDAV_BREAKER_COOLDOWN', 60), \
+            patch.dict(server.caldav_services_map, {account: MagicMock()}):
+        await tool(account)
+        await tool(account)
+        result = await tool(account) # Breaker is open: no call reaches the tool
+        assert result["status"] == "error" and "unavailable" in result["message"]
+        assert len(calls) == 2
 
-    expected_error = [{"status": "error", "message": "Account identifier 'http://fake.tasks/dav' not found."}]
-    assert result == expected_error
+        server._breakers[account][1] -= 60 # Cooldown over: one probe goes through
+        assert await tool(account) == {"status": "success"}
+        assert account not in server._breakers
 
-    if server.caldav_services_map:
-        real_service = server.caldav_services_map["http://real.tasks/dav"]
-        real_service.get_tasks.assert_not_called()
+@pytest.mark.parametrize("exc", [requests.exceptions.ConnectionError("reset"), requests.exceptions.ReadTimeout("slow")])
+async def test_requests_errors_from_a_tool_count_towards_the_breaker(exc):
+    account = "http://breaker.test/dav"
+    service = MagicMock()
+    service.get_tasks = AsyncMock(side_effect=exc) # Raised by a request after connect()
+
+    with patch.object(server, 'CALDAV_BREAKER_THRESHOLD', 1), patch.object(server, 'CALDAV_BREAKER_COOLDOWN', 60), \
+            patch.dict(server.caldav_services_map, {account: service}), patch.dict(server._breakers):
+        result = await server.list_caldav_tasks(account_identifier=account, calendar_url="http://breaker.test/cal")
+        assert result == [{"status": "error", "message": f"CalDAV connection error for account {account}: {exc}"}]
+
+        result = await server.list_caldav_tasks(account_identifier=account, calendar_url="http://breaker.test/cal")
+        assert "unavailable" in result[0]["message"] # The breaker opened
+        service.get_tasks.assert_awaited_once()